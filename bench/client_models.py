@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for decoding and encoding binctl_client models.
+
+Each case converts a large synthetic payload shaped like the API's
+responses (list pages, node detail with children and tags) and is timed
+over several rounds; the report gives the best and mean round, the cost
+per item and the memory the result holds on to per item. --save writes
+the results as a baseline; --compare checks them against one and exits 1
+if a case got slower, or its result bigger, than --tolerance allows.
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'binctl-client'))
+
+from binctl_client.models import Node, NodeChild, Tag  # noqa: E402
+from binctl_client.records import NodeRecord, TagRecord, decode_list  # noqa: E402
+
+
+# --------------------------------------------------------------------
+# Payloads, as the API serialises them. Timestamps differ per item, so
+# the records can't share them.
+# --------------------------------------------------------------------
+def timestamp(i, day):
+    return f'2024-05-{day:02d}T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}'
+
+
+def node_dict(i):
+    return {
+        'id': i,
+        'label': f'item-{i}',
+        'description': None if i % 2 else f'Benchmark node {i}',
+        'is_container': i % 5 == 0,
+        'created_at': timestamp(i, 1),
+        'updated_at': timestamp(i, 2),
+    }
+
+
+def tag_dict(i):
+    return {
+        'id': i,
+        'name': f'tag-{i:05d}',
+        'created_at': timestamp(i, 1),
+        'updated_at': timestamp(i, 2),
+    }
+
+
+def node_detail_dict(i, children, tags):
+    return dict(
+        node_dict(i),
+        parent_id=None,
+        children=[node_dict(i + 1 + c) for c in range(children)],
+        tags=[tag_dict(t + 1) for t in range(tags)],
+    )
+
+
+def cases(size):
+    """
+    Returns [(name, items per round, function)]. Each function does one
+    round of work; payloads and model instances are built up front.
+    Payloads go through JSON so that, like a response, no two items share
+    a string.
+    """
+    body = json.dumps([node_dict(i) for i in range(1, size + 1)]).encode()
+    nodes = json.loads(body)
+    tags = json.loads(json.dumps([tag_dict(i) for i in range(1, size + 1)]))
+    details = json.loads(json.dumps([node_detail_dict(i * 1000, 100, 10) for i in range(1, size // 100 + 1)]))
+
+    node_models = [Node.from_dict(n) for n in nodes]
+    child_models = [NodeChild.from_dict(n) for n in nodes]
+    tag_models = [Tag.from_dict(t) for t in tags]
+    detail_models = [Node.from_dict(d) for d in details]
+    node_records = decode_list(nodes, NodeRecord)
+
+    return [
+        ('json.loads node list', size, lambda: json.loads(body)),
+        ('Node.from_dict list', size, lambda: [Node.from_dict(n) for n in nodes]),
+        ('Node.to_dict list', size, lambda: [n.to_dict() for n in node_models]),
+        ('Node.from_dict detail', len(details), lambda: [Node.from_dict(d) for d in details]),
+        ('Node.to_dict detail', len(details), lambda: [n.to_dict() for n in detail_models]),
+        ('NodeChild.from_dict', size, lambda: [NodeChild.from_dict(n) for n in nodes]),
+        ('NodeChild.to_dict', size, lambda: [n.to_dict() for n in child_models]),
+        ('Tag.from_dict', size, lambda: [Tag.from_dict(t) for t in tags]),
+        ('Tag.to_dict', size, lambda: [t.to_dict() for t in tag_models]),
+        ('NodeRecord.from_dict list', size, lambda: decode_list(nodes, NodeRecord)),
+        ('NodeRecord.to_dict list', size, lambda: [n.to_dict() for n in node_records]),
+        # Parses every timestamp: what deferring costs if everything is read
+        ('NodeRecord timestamps', size, lambda: [(n.created_at, n.updated_at) for n in decode_list(nodes, NodeRecord)]),
+        ('TagRecord.from_dict', size, lambda: decode_list(tags, TagRecord)),
+    ]
+
+
+# --------------------------------------------------------------------
+# Running
+# --------------------------------------------------------------------
+def measure(func, rounds):
+    """
+    Times rounds calls of func, with a collection between rounds so
+    garbage from one round isn't charged to the next.
+    """
+    timings = []
+
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    return timings
+
+
+def retained(func):
+    """
+    Bytes allocated by one call of func that its result still holds.
+    Objects shared with the input payload aren't counted, so records,
+    which keep its strings, look smaller than they are end to end.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = func()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=100_000, help='Items per list payload (default 100000)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed rounds per case (default 5)')
+    parser.add_argument('--cases', nargs='+', metavar='SUBSTRING', help='Only run cases whose name contains one')
+    parser.add_argument('--save', metavar='FILE', help='Write the results as a baseline')
+    parser.add_argument('--compare', metavar='FILE', help='Compare against a baseline; exit 1 on a regression')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed growth of time or memory (0.2)')
+    args = parser.parse_args()
+
+    baseline = None
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        if baseline['meta']['size'] != args.size:
+            print('Warning: baseline was taken with a different --size', file=sys.stderr)
+
+        baseline = baseline['cases']
+
+    header = f'{"case":<26} {"items":>7} {"min ms":>9} {"mean ms":>9} {"stdev":>7} {"us/item":>8} {"B/item":>7}'
+    print(header)
+    print('-' * len(header))
+
+    results = {}
+    regressions = []
+
+    for name, items, func in cases(args.size):
+        if args.cases and not any(part in name for part in args.cases):
+            continue
+
+        timings = measure(func, args.rounds)
+        result = {
+            'items': items,
+            'min_ms': round(min(timings) * 1000, 2),
+            'mean_ms': round(statistics.mean(timings) * 1000, 2),
+            'stdev_ms': round(statistics.stdev(timings) * 1000, 2) if len(timings) > 1 else 0.0,
+            'us_per_item': round(min(timings) / items * 1e6, 3),
+            'bytes_per_item': round(retained(func) / items),
+        }
+        results[name] = result
+
+        print(
+            f'{name:<26} {items:>7} {result["min_ms"]:>9.2f} {result["mean_ms"]:>9.2f} '
+            f'{result["stdev_ms"]:>7.2f} {result["us_per_item"]:>8.3f} {result["bytes_per_item"]:>7}'
+        )
+
+        if baseline and name in baseline:
+            b = baseline[name]
+            print(
+                f'{"  baseline":<26} {"":>7} {b["min_ms"]:>9.2f} {b["mean_ms"]:>9.2f} {"":>7} '
+                f'{b["us_per_item"]:>8.3f} {b["bytes_per_item"]:>7}'
+            )
+
+            if result['us_per_item'] > b['us_per_item'] * (1 + args.tolerance):
+                regressions.append(f'{name}: {result["us_per_item"]} us/item vs {b["us_per_item"]}')
+
+            if result['bytes_per_item'] > b['bytes_per_item'] * (1 + args.tolerance):
+                regressions.append(f'{name}: {result["bytes_per_item"]} bytes/item vs {b["bytes_per_item"]}')
+
+    if args.save:
+        meta = {'size': args.size, 'rounds': args.rounds, 'python': sys.version.split()[0]}
+
+        with open(args.save, 'w') as f:
+            json.dump({'meta': meta, 'cases': results}, f, indent=2)
+            f.write('\n')
+
+    for line in regressions:
+        print(f'REGRESSION {line}', file=sys.stderr)
+
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Load test for a running binctl API, seeded by seed.py.
+
+Every operationId in openapi.yaml is driven in turn by --concurrency
+workers until --requests requests have completed, and reported as
+throughput, p50/p99 latency and SQL queries per request (read from the
+Server-Timing header). --save writes the results as a baseline;
+--compare checks them against one and exits 1 on a regression.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import yaml
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'openapi.yaml')
+
+SERVER_TIMING_QUERIES = re.compile(r'db;desc="(\d+) queries')
+
+
+# --------------------------------------------------------------------
+# Scenarios: operationId -> function(rng, manifest) returning the
+# (method, path, httpx keyword arguments) of one request
+# --------------------------------------------------------------------
+def items(manifest):
+    return manifest['levels'][-1]
+
+
+def containers(manifest, from_bottom=1):
+    """
+    Containers from_bottom levels above the items; their trees are small.
+    """
+    return manifest['levels'][max(0, len(manifest['levels']) - 1 - from_bottom)]
+
+
+def random_node(rng, level):
+    return rng.randint(*level)
+
+
+def random_tag(rng, manifest):
+    return rng.randint(1, manifest['tags'])
+
+
+SCENARIOS = {
+    'get_nodes_list': lambda rng, m: ('GET', '/v1/nodes', {'params': {'limit': 100}}),
+    'get_node_detail': lambda rng, m: ('GET', f'/v1/node/{random_node(rng, containers(m))}', {}),
+    'get_node_path': lambda rng, m: ('GET', f'/v1/node/{random_node(rng, items(m))}/path', {}),
+    'get_node_tree': lambda rng, m: (
+        'GET',
+        f'/v1/node/{random_node(rng, containers(m, 2))}/tree',
+        {'params': {'include_tags': 'true'}},
+    ),
+    'get_nodes_paths': lambda rng, m: (
+        'GET',
+        '/v1/nodes/paths',
+        {'params': {'node_ids': [random_node(rng, items(m)) for _ in range(50)]}},
+    ),
+    'get_tags_list': lambda rng, m: ('GET', '/v1/tags', {'params': {'limit': 100}}),
+    'get_tag_detail': lambda rng, m: ('GET', f'/v1/tag/{random_tag(rng, m)}', {}),
+    'post_node_create': lambda rng, m: (
+        'POST',
+        '/v1/node',
+        {
+            'json': {
+                'label': f'bench-{uuid.uuid4().hex[:12]}',
+                'parent_id': random_node(rng, containers(m)),
+                'tag_ids': [random_tag(rng, m)],
+            }
+        },
+    ),
+    'post_nodes_bulk_create': lambda rng, m: (
+        'POST',
+        '/v1/nodes/bulk',
+        {
+            'json': [
+                {
+                    'ref': 'box',
+                    'label': 'bench-box',
+                    'is_container': True,
+                    'parent_id': random_node(rng, containers(m)),
+                },
+                *({'label': f'bench-item-{i}', 'parent_ref': 'box'} for i in range(9)),
+            ]
+        },
+    ),
+    'post_nodes_move': lambda rng, m: (
+        'POST',
+        '/v1/nodes/move',
+        {
+            'json': {
+                'node_ids': [random_node(rng, items(m)) for _ in range(5)],
+                'parent_id': random_node(rng, containers(m)),
+            }
+        },
+    ),
+    'post_node_update': lambda rng, m: (
+        'POST',
+        f'/v1/node/{random_node(rng, items(m))}',
+        {'json': {'description': f'Updated by loadtest {uuid.uuid4().hex[:8]}'}},
+    ),
+    'post_tag_create': lambda rng, m: ('POST', '/v1/tag', {'json': {'name': f'bench-{uuid.uuid4().hex}'}}),
+    'post_tag_update': lambda rng, m: (
+        # Renames to the seeded name, so the data stays as seed.py left it
+        'POST',
+        f'/v1/tag/{(tag_id := random_tag(rng, m))}',
+        {'json': {'name': f'tag-{tag_id:05d}'}},
+    ),
+    'post_tag_nodes_update': lambda rng, m: (
+        'POST',
+        f'/v1/tag/{random_tag(rng, m)}/nodes',
+        {
+            'json': {
+                'add': [random_node(rng, items(m)) for _ in range(5)],
+                'remove': [random_node(rng, items(m)) for _ in range(5)],
+            }
+        },
+    ),
+}
+
+
+def spec_operation_ids():
+    with open(SPEC_PATH) as f:
+        spec = yaml.safe_load(f)
+
+    return [
+        operation['operationId']
+        for item in spec['paths'].values()
+        for method, operation in item.items()
+        if method != 'parameters'
+    ]
+
+
+# --------------------------------------------------------------------
+# Running
+# --------------------------------------------------------------------
+def percentile(values, p):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def run_operation(base_url, operation_id, manifest, args):
+    scenario = SCENARIOS[operation_id]
+    samples = []  # (seconds, status, queries or None)
+    lock = threading.Lock()
+    issued = itertools.count()
+    warmed_up = None  # When the last warm-up request finished
+
+    def worker(number):
+        nonlocal warmed_up
+
+        rng = random.Random(f'{args.random_seed}-{operation_id}-{number}')
+
+        with httpx.Client(base_url=base_url, timeout=args.timeout) as client:
+            while next(issued) < args.warmup + args.requests:
+                method, path, kwargs = scenario(rng, manifest)
+                started = time.perf_counter()
+                resp = client.request(method, path, **kwargs)
+                elapsed = time.perf_counter() - started
+
+                match = SERVER_TIMING_QUERIES.search(resp.headers.get('Server-Timing', ''))
+
+                with lock:
+                    samples.append((elapsed, resp.status_code, int(match.group(1)) if match else None))
+
+                    if len(samples) == args.warmup:
+                        warmed_up = time.perf_counter()
+
+    if not args.warmup:
+        warmed_up = time.perf_counter()
+
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        for future in [pool.submit(worker, i) for i in range(args.concurrency)]:
+            future.result()
+
+    # Throughput of the measured requests only, over the time they took
+    wall = time.perf_counter() - warmed_up
+
+    # Completion order, so the warm-up is the first requests to finish
+    measured = samples[args.warmup :]
+    latencies = sorted(seconds for seconds, _, _ in measured)
+    queries = [q for _, _, q in measured if q is not None]
+
+    return {
+        'requests': len(measured),
+        'errors': sum(1 for _, status, _ in measured if status >= 400),
+        'rps': round(len(measured) / wall, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'queries': round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def print_report(results, baseline=None):
+    header = f'{"operation":<24} {"requests":>8} {"errors":>6} {"req/s":>8} {"p50 ms":>9} {"p99 ms":>9} {"queries":>7}'
+    print(header)
+    print('-' * len(header))
+
+    for operation_id, r in results.items():
+        queries = '-' if r['queries'] is None else f'{r["queries"]:.2f}'
+        print(
+            f'{operation_id:<24} {r["requests"]:>8} {r["errors"]:>6} {r["rps"]:>8.1f} '
+            f'{r["p50_ms"]:>9.2f} {r["p99_ms"]:>9.2f} {queries:>7}'
+        )
+
+        if baseline and operation_id in baseline:
+            b = baseline[operation_id]
+            queries = '-' if b['queries'] is None else f'{b["queries"]:.2f}'
+            print(
+                f'{"  baseline":<24} {"":>8} {"":>6} {b["rps"]:>8.1f} '
+                f'{b["p50_ms"]:>9.2f} {b["p99_ms"]:>9.2f} {queries:>7}'
+            )
+
+
+def regressions(results, baseline, tolerance):
+    """
+    Latency may grow by tolerance (a fraction) before it counts; queries
+    per request get a 10% margin for cache hits that vary between runs.
+    Failed requests count for every operation, and an operation missing
+    from the baseline counts too, so it can't go unchecked.
+    """
+    found = []
+
+    for operation_id, r in results.items():
+        if r['errors']:
+            found.append(f'{operation_id}: {r["errors"]} failed requests')
+
+        b = baseline.get(operation_id)
+
+        if b is None:
+            found.append(f'{operation_id}: not in the baseline; take a new one with --save')
+            continue
+
+        for key in ('p50_ms', 'p99_ms'):
+            if r[key] > b[key] * (1 + tolerance):
+                found.append(f'{operation_id}: {key} {r[key]} vs {b[key]}')
+
+        if r['queries'] is not None and b['queries'] is not None and r['queries'] > b['queries'] * 1.1 + 0.05:
+            found.append(f'{operation_id}: {r["queries"]} queries per request vs {b["queries"]}')
+
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--base-url', default='http://localhost:5000', help='API to test (default http://localhost:5000)'
+    )
+    parser.add_argument('--manifest', default='bench/seed.json', help='Id ranges written by seed.py')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent clients (default 8)')
+    parser.add_argument('--requests', type=int, default=500, help='Measured requests per operation (default 500)')
+    parser.add_argument('--warmup', type=int, default=20, help='Unmeasured requests per operation first (default 20)')
+    parser.add_argument('--timeout', type=float, default=60, help='Request timeout in seconds (default 60)')
+    parser.add_argument('--random-seed', type=int, default=1, help='Seed for request targets (default 1)')
+    parser.add_argument('--operations', nargs='+', metavar='OPERATION_ID', help='Only run these operations')
+    parser.add_argument('--read-only', action='store_true', help='Skip the write operations (needed on SQLite)')
+    parser.add_argument('--save', metavar='FILE', help='Write the results as a baseline')
+    parser.add_argument('--compare', metavar='FILE', help='Compare against a baseline; exit 1 on a regression')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed latency growth (default 0.25)')
+    args = parser.parse_args()
+
+    operation_ids = spec_operation_ids()
+    missing = [operation_id for operation_id in operation_ids if operation_id not in SCENARIOS]
+
+    if missing:
+        raise SystemExit(f'No load test scenario for {", ".join(missing)}; add one to SCENARIOS')
+
+    if args.operations:
+        unknown = set(args.operations) - set(operation_ids)
+
+        if unknown:
+            raise SystemExit(f'Unknown operations: {", ".join(sorted(unknown))}')
+
+        operation_ids = [operation_id for operation_id in operation_ids if operation_id in args.operations]
+
+    if args.read_only:
+        operation_ids = [operation_id for operation_id in operation_ids if not operation_id.startswith('post_')]
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+
+    baseline = None
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        if (baseline['meta']['nodes'], baseline['meta']['concurrency']) != (manifest['nodes'], args.concurrency):
+            print('Warning: baseline was taken with a different data set or concurrency', file=sys.stderr)
+
+    results = {}
+
+    for operation_id in operation_ids:
+        print(f'Running {operation_id}...', file=sys.stderr)
+        results[operation_id] = run_operation(args.base_url, operation_id, manifest, args)
+
+    print_report(results, baseline and baseline['operations'])
+
+    if args.save:
+        meta = {
+            'nodes': manifest['nodes'],
+            'tags': manifest['tags'],
+            'depth': manifest['depth'],
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'date': time.strftime('%Y-%m-%d'),
+        }
+
+        with open(args.save, 'w') as f:
+            json.dump({'meta': meta, 'operations': results}, f, indent=2)
+            f.write('\n')
+
+    if baseline:
+        found = regressions(results, baseline['operations'], args.tolerance)
+
+        for line in found:
+            print(f'REGRESSION {line}', file=sys.stderr)
+
+        if found:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+from http import HTTPStatus
+from typing import Any, cast
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.node_child import NodeChild
+from ...types import Response
+
+
+def _get_kwargs(
+    node_id: int,
+) -> dict[str, Any]:
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/v1/node/{node_id}/path",
+    }
+
+    return _kwargs
+
+
+def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> Any | list[NodeChild] | None:
+    if response.status_code == 200:
+        response_200 = []
+        _response_200 = response.json()
+        for response_200_item_data in _response_200:
+            response_200_item = NodeChild.from_dict(response_200_item_data)
+
+            response_200.append(response_200_item)
+
+        return response_200
+
+    if response.status_code == 404:
+        response_404 = cast(Any, None)
+        return response_404
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[Any | list[NodeChild]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+) -> Response[Any | list[NodeChild]]:
+    """Locate a node
+
+    Returns the chain of nodes from the top-level container down to the node itself.
+
+    Args:
+        node_id (int):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Any | list[NodeChild]]
+    """
+
+    kwargs = _get_kwargs(
+        node_id=node_id,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+) -> Any | list[NodeChild] | None:
+    """Locate a node
+
+    Returns the chain of nodes from the top-level container down to the node itself.
+
+    Args:
+        node_id (int):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Any | list[NodeChild]
+    """
+
+    return sync_detailed(
+        node_id=node_id,
+        client=client,
+    ).parsed
+
+
+async def asyncio_detailed(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+) -> Response[Any | list[NodeChild]]:
+    """Locate a node
+
+    Returns the chain of nodes from the top-level container down to the node itself.
+
+    Args:
+        node_id (int):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Any | list[NodeChild]]
+    """
+
+    kwargs = _get_kwargs(
+        node_id=node_id,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+) -> Any | list[NodeChild] | None:
+    """Locate a node
+
+    Returns the chain of nodes from the top-level container down to the node itself.
+
+    Args:
+        node_id (int):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Any | list[NodeChild]
+    """
+
+    return (
+        await asyncio_detailed(
+            node_id=node_id,
+            client=client,
+        )
+    ).parsed
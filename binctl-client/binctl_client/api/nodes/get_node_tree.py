@@ -0,0 +1,233 @@
+from http import HTTPStatus
+from typing import Any, cast
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.tree_node import TreeNode
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    node_id: int,
+    *,
+    max_depth: int | Unset = UNSET,
+    include_tags: bool | Unset = False,
+    stream: bool | Unset = False,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["max_depth"] = max_depth
+
+    params["include_tags"] = include_tags
+
+    params["stream"] = stream
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/v1/node/{node_id}/tree",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> Any | list[TreeNode] | None:
+    if response.status_code == 200:
+        response_200 = []
+        _response_200 = response.json()
+        for response_200_item_data in _response_200:
+            response_200_item = TreeNode.from_dict(response_200_item_data)
+
+            response_200.append(response_200_item)
+
+        return response_200
+
+    if response.status_code == 404:
+        response_404 = cast(Any, None)
+        return response_404
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[Any | list[TreeNode]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+    max_depth: int | Unset = UNSET,
+    include_tags: bool | Unset = False,
+    stream: bool | Unset = False,
+) -> Response[Any | list[TreeNode]]:
+    """Get a node and everything inside it
+
+    Returns the node followed by all of its descendants in depth-first order (siblings by id). Each
+    entry carries its depth below the requested node and its parent_id. With `stream=true` or `Accept:
+    application/x-ndjson` the nodes are streamed one per line, level by level instead (by depth, then
+    id), so every node follows its parent and the server never holds the whole subtree.
+
+    Args:
+        node_id (int):
+        max_depth (int | Unset): Only include nodes at most this many levels below the requested node.
+        include_tags (bool | Unset): Include each node's tags. Default: False.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Any | list[TreeNode]]
+    """
+
+    kwargs = _get_kwargs(
+        node_id=node_id,
+        max_depth=max_depth,
+        include_tags=include_tags,
+        stream=stream,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+    max_depth: int | Unset = UNSET,
+    include_tags: bool | Unset = False,
+    stream: bool | Unset = False,
+) -> Any | list[TreeNode] | None:
+    """Get a node and everything inside it
+
+    Returns the node followed by all of its descendants in depth-first order (siblings by id). Each
+    entry carries its depth below the requested node and its parent_id. With `stream=true` or `Accept:
+    application/x-ndjson` the nodes are streamed one per line, level by level instead (by depth, then
+    id), so every node follows its parent and the server never holds the whole subtree.
+
+    Args:
+        node_id (int):
+        max_depth (int | Unset): Only include nodes at most this many levels below the requested node.
+        include_tags (bool | Unset): Include each node's tags. Default: False.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Any | list[TreeNode]
+    """
+
+    return sync_detailed(
+        node_id=node_id,
+        client=client,
+        max_depth=max_depth,
+        include_tags=include_tags,
+        stream=stream,
+    ).parsed
+
+
+async def asyncio_detailed(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+    max_depth: int | Unset = UNSET,
+    include_tags: bool | Unset = False,
+    stream: bool | Unset = False,
+) -> Response[Any | list[TreeNode]]:
+    """Get a node and everything inside it
+
+    Returns the node followed by all of its descendants in depth-first order (siblings by id). Each
+    entry carries its depth below the requested node and its parent_id. With `stream=true` or `Accept:
+    application/x-ndjson` the nodes are streamed one per line, level by level instead (by depth, then
+    id), so every node follows its parent and the server never holds the whole subtree.
+
+    Args:
+        node_id (int):
+        max_depth (int | Unset): Only include nodes at most this many levels below the requested node.
+        include_tags (bool | Unset): Include each node's tags. Default: False.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Any | list[TreeNode]]
+    """
+
+    kwargs = _get_kwargs(
+        node_id=node_id,
+        max_depth=max_depth,
+        include_tags=include_tags,
+        stream=stream,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    node_id: int,
+    *,
+    client: AuthenticatedClient | Client,
+    max_depth: int | Unset = UNSET,
+    include_tags: bool | Unset = False,
+    stream: bool | Unset = False,
+) -> Any | list[TreeNode] | None:
+    """Get a node and everything inside it
+
+    Returns the node followed by all of its descendants in depth-first order (siblings by id). Each
+    entry carries its depth below the requested node and its parent_id. With `stream=true` or `Accept:
+    application/x-ndjson` the nodes are streamed one per line, level by level instead (by depth, then
+    id), so every node follows its parent and the server never holds the whole subtree.
+
+    Args:
+        node_id (int):
+        max_depth (int | Unset): Only include nodes at most this many levels below the requested node.
+        include_tags (bool | Unset): Include each node's tags. Default: False.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Any | list[TreeNode]
+    """
+
+    return (
+        await asyncio_detailed(
+            node_id=node_id,
+            client=client,
+            max_depth=max_depth,
+            include_tags=include_tags,
+            stream=stream,
+        )
+    ).parsed
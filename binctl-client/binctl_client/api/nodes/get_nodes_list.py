@@ -6,13 +6,29 @@ import httpx
 from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.node import Node
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
-def _get_kwargs() -> dict[str, Any]:
+def _get_kwargs(
+    *,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    stream: bool | Unset = False,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["limit"] = limit
+
+    params["after"] = after
+
+    params["stream"] = stream
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     _kwargs: dict[str, Any] = {
         "method": "get",
         "url": "/v1/nodes",
+        "params": params,
     }
 
     return _kwargs
@@ -47,9 +63,23 @@ def _build_response(*, client: AuthenticatedClient | Client, response: httpx.Res
 def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    stream: bool | Unset = False,
 ) -> Response[list[Node]]:
     """List all nodes
 
+    Nodes are returned ordered by id. Pass `limit` to page through them; when more nodes remain,
+    the `X-Next-Cursor` response header holds the cursor to pass as `after` for the next page. With
+    `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per line
+    and carries no cursor.
+
+    Args:
+        limit (int | Unset): Maximum number of items to return. Omit to return every item.
+        after (str | Unset): Opaque cursor from a previous page's `X-Next-Cursor` header.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
@@ -58,7 +88,11 @@ def sync_detailed(
         Response[list[Node]]
     """
 
-    kwargs = _get_kwargs()
+    kwargs = _get_kwargs(
+        limit=limit,
+        after=after,
+        stream=stream,
+    )
 
     response = client.get_httpx_client().request(
         **kwargs,
@@ -70,9 +104,23 @@ def sync_detailed(
 def sync(
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    stream: bool | Unset = False,
 ) -> list[Node] | None:
     """List all nodes
 
+    Nodes are returned ordered by id. Pass `limit` to page through them; when more nodes remain,
+    the `X-Next-Cursor` response header holds the cursor to pass as `after` for the next page. With
+    `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per line
+    and carries no cursor.
+
+    Args:
+        limit (int | Unset): Maximum number of items to return. Omit to return every item.
+        after (str | Unset): Opaque cursor from a previous page's `X-Next-Cursor` header.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
@@ -83,15 +131,32 @@ def sync(
 
     return sync_detailed(
         client=client,
+        limit=limit,
+        after=after,
+        stream=stream,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    stream: bool | Unset = False,
 ) -> Response[list[Node]]:
     """List all nodes
 
+    Nodes are returned ordered by id. Pass `limit` to page through them; when more nodes remain,
+    the `X-Next-Cursor` response header holds the cursor to pass as `after` for the next page. With
+    `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per line
+    and carries no cursor.
+
+    Args:
+        limit (int | Unset): Maximum number of items to return. Omit to return every item.
+        after (str | Unset): Opaque cursor from a previous page's `X-Next-Cursor` header.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
@@ -100,7 +165,11 @@ async def asyncio_detailed(
         Response[list[Node]]
     """
 
-    kwargs = _get_kwargs()
+    kwargs = _get_kwargs(
+        limit=limit,
+        after=after,
+        stream=stream,
+    )
 
     response = await client.get_async_httpx_client().request(**kwargs)
 
@@ -110,9 +179,23 @@ async def asyncio_detailed(
 async def asyncio(
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    stream: bool | Unset = False,
 ) -> list[Node] | None:
     """List all nodes
 
+    Nodes are returned ordered by id. Pass `limit` to page through them; when more nodes remain,
+    the `X-Next-Cursor` response header holds the cursor to pass as `after` for the next page. With
+    `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per line
+    and carries no cursor.
+
+    Args:
+        limit (int | Unset): Maximum number of items to return. Omit to return every item.
+        after (str | Unset): Opaque cursor from a previous page's `X-Next-Cursor` header.
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
@@ -124,5 +207,8 @@ async def asyncio(
     return (
         await asyncio_detailed(
             client=client,
+            limit=limit,
+            after=after,
+            stream=stream,
         )
     ).parsed
@@ -0,0 +1,178 @@
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.node_path import NodePath
+from ...types import UNSET, Response
+
+
+def _get_kwargs(
+    *,
+    node_ids: list[int],
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    json_node_ids = node_ids
+
+    params["node_ids"] = json_node_ids
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": "/v1/nodes/paths",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> list[NodePath] | None:
+    if response.status_code == 200:
+        response_200 = []
+        _response_200 = response.json()
+        for response_200_item_data in _response_200:
+            response_200_item = NodePath.from_dict(response_200_item_data)
+
+            response_200.append(response_200_item)
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> Response[list[NodePath]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    node_ids: list[int],
+) -> Response[list[NodePath]]:
+    """Locate many nodes
+
+    Returns the root-to-node chain for each requested node, in request order. Unknown node ids are
+    left out of the result. At most 250 ids per request, so the request line stays within the 8190
+    bytes the bundled gunicorn config accepts.
+
+    Args:
+        node_ids (list[int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list[NodePath]]
+    """
+
+    kwargs = _get_kwargs(
+        node_ids=node_ids,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: AuthenticatedClient | Client,
+    node_ids: list[int],
+) -> list[NodePath] | None:
+    """Locate many nodes
+
+    Returns the root-to-node chain for each requested node, in request order. Unknown node ids are
+    left out of the result. At most 250 ids per request, so the request line stays within the 8190
+    bytes the bundled gunicorn config accepts.
+
+    Args:
+        node_ids (list[int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list[NodePath]
+    """
+
+    return sync_detailed(
+        client=client,
+        node_ids=node_ids,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    node_ids: list[int],
+) -> Response[list[NodePath]]:
+    """Locate many nodes
+
+    Returns the root-to-node chain for each requested node, in request order. Unknown node ids are
+    left out of the result. At most 250 ids per request, so the request line stays within the 8190
+    bytes the bundled gunicorn config accepts.
+
+    Args:
+        node_ids (list[int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list[NodePath]]
+    """
+
+    kwargs = _get_kwargs(
+        node_ids=node_ids,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: AuthenticatedClient | Client,
+    node_ids: list[int],
+) -> list[NodePath] | None:
+    """Locate many nodes
+
+    Returns the root-to-node chain for each requested node, in request order. Unknown node ids are
+    left out of the result. At most 250 ids per request, so the request line stays within the 8190
+    bytes the bundled gunicorn config accepts.
+
+    Args:
+        node_ids (list[int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list[NodePath]
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+            node_ids=node_ids,
+        )
+    ).parsed
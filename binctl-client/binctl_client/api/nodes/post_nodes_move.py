@@ -0,0 +1,177 @@
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.node_path import NodePath
+from ...models.nodes_move import NodesMove
+from ...types import Response
+
+
+def _get_kwargs(
+    *,
+    body: NodesMove,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "post",
+        "url": "/v1/nodes/move",
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> list[NodePath] | None:
+    if response.status_code == 200:
+        response_200 = []
+        _response_200 = response.json()
+        for response_200_item_data in _response_200:
+            response_200_item = NodePath.from_dict(response_200_item_data)
+
+            response_200.append(response_200_item)
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> Response[list[NodePath]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    body: NodesMove,
+) -> Response[list[NodePath]]:
+    """Move many nodes
+
+    Moves all nodes under `parent_id` (or to the top level if it is null) in one transaction. The
+    request is rejected as a whole if any node is unknown or if the parent is inside one of the moved
+    subtrees. Returns the new path of each moved node.
+
+    Args:
+        body (NodesMove):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list[NodePath]]
+    """
+
+    kwargs = _get_kwargs(
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: AuthenticatedClient | Client,
+    body: NodesMove,
+) -> list[NodePath] | None:
+    """Move many nodes
+
+    Moves all nodes under `parent_id` (or to the top level if it is null) in one transaction. The
+    request is rejected as a whole if any node is unknown or if the parent is inside one of the moved
+    subtrees. Returns the new path of each moved node.
+
+    Args:
+        body (NodesMove):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list[NodePath]
+    """
+
+    return sync_detailed(
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    body: NodesMove,
+) -> Response[list[NodePath]]:
+    """Move many nodes
+
+    Moves all nodes under `parent_id` (or to the top level if it is null) in one transaction. The
+    request is rejected as a whole if any node is unknown or if the parent is inside one of the moved
+    subtrees. Returns the new path of each moved node.
+
+    Args:
+        body (NodesMove):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list[NodePath]]
+    """
+
+    kwargs = _get_kwargs(
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: AuthenticatedClient | Client,
+    body: NodesMove,
+) -> list[NodePath] | None:
+    """Move many nodes
+
+    Moves all nodes under `parent_id` (or to the top level if it is null) in one transaction. The
+    request is rejected as a whole if any node is unknown or if the parent is inside one of the moved
+    subtrees. Returns the new path of each moved node.
+
+    Args:
+        body (NodesMove):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list[NodePath]
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+            body=body,
+        )
+    ).parsed
@@ -6,15 +6,24 @@ import httpx
 from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.tag import Tag
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     tag_id: int,
+    *,
+    stream: bool | Unset = False,
 ) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["stream"] = stream
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     _kwargs: dict[str, Any] = {
         "method": "get",
         "url": f"/v1/tag/{tag_id}",
+        "params": params,
     }
 
     return _kwargs
@@ -49,11 +58,17 @@ def sync_detailed(
     tag_id: int,
     *,
     client: AuthenticatedClient | Client,
+    stream: bool | Unset = False,
 ) -> Response[Any | Tag]:
     """Get tag by ID
 
+    With `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per
+    line: the tag first, then each of its nodes.
+
     Args:
         tag_id (int):
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -65,6 +80,7 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         tag_id=tag_id,
+        stream=stream,
     )
 
     response = client.get_httpx_client().request(
@@ -78,11 +94,17 @@ def sync(
     tag_id: int,
     *,
     client: AuthenticatedClient | Client,
+    stream: bool | Unset = False,
 ) -> Any | Tag | None:
     """Get tag by ID
 
+    With `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per
+    line: the tag first, then each of its nodes.
+
     Args:
         tag_id (int):
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -95,6 +117,7 @@ def sync(
     return sync_detailed(
         tag_id=tag_id,
         client=client,
+        stream=stream,
     ).parsed
 
 
@@ -102,11 +125,17 @@ async def asyncio_detailed(
     tag_id: int,
     *,
     client: AuthenticatedClient | Client,
+    stream: bool | Unset = False,
 ) -> Response[Any | Tag]:
     """Get tag by ID
 
+    With `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per
+    line: the tag first, then each of its nodes.
+
     Args:
         tag_id (int):
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -118,6 +147,7 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         tag_id=tag_id,
+        stream=stream,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -129,11 +159,17 @@ async def asyncio(
     tag_id: int,
     *,
     client: AuthenticatedClient | Client,
+    stream: bool | Unset = False,
 ) -> Any | Tag | None:
     """Get tag by ID
 
+    With `stream=true` or `Accept: application/x-ndjson` the response is streamed as one JSON object per
+    line: the tag first, then each of its nodes.
+
     Args:
         tag_id (int):
+        stream (bool | Unset): Stream the response as newline-delimited JSON (application/x-ndjson).
+            Default: False.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -147,5 +183,6 @@ async def asyncio(
         await asyncio_detailed(
             tag_id=tag_id,
             client=client,
+            stream=stream,
         )
     ).parsed
@@ -0,0 +1,247 @@
+"""Conditional GET support for the generated client.
+
+Not generated: ``genclient.sh`` restores this file after regenerating the client.
+
+Pass one of the transports to a client to revalidate repeated GETs with ``If-None-Match``
+instead of downloading the same body again::
+
+    client = Client(base_url=..., httpx_args={"transport": ConditionalTransport()})
+
+The default ``ResponseCache`` lives as long as the transport. Short-lived processes, such as
+one-shot CLI commands, can pass a ``DiskResponseCache`` to revalidate across runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import httpx
+from attrs import define
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Describe the encoded body, which is not what we replay
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+@define
+class CachedResponse:
+    etag: str
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+class ResponseCache:
+    """LRU store of the last ETag-bearing response per URL and Accept header.
+
+    Holds at most ``max_entries`` responses and ``max_bytes`` of bodies, so paging through a big list
+    doesn't keep every page around; a body larger than ``max_bytes`` is not stored at all.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 4 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: httpx.Request) -> tuple[str, str]:
+        return str(request.url), request.headers.get("accept", "")
+
+    def get(self, request: httpx.Request) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(self.key(request))
+
+            if entry is not None:
+                self._entries.move_to_end(self.key(request))
+
+            return entry
+
+    @staticmethod
+    def entry(response: httpx.Response) -> CachedResponse:
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROPPED_HEADERS]
+        return CachedResponse(etag=response.headers["etag"], headers=headers, content=response.content)
+
+    def put(self, request: httpx.Request, response: httpx.Response) -> None:
+        entry = self.entry(response)
+        key = self.key(request)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+
+            if old is not None:
+                self._size -= len(old.content)
+
+            if len(entry.content) > self.max_bytes:
+                return
+
+            self._entries[key] = entry
+            self._size += len(entry.content)
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def prepare(self, request: httpx.Request) -> CachedResponse | None:
+        """Adds If-None-Match to a GET we have a cached response for."""
+        if request.method != "GET" or "if-none-match" in request.headers:
+            return None
+
+        cached = self.get(request)
+
+        if cached is not None:
+            request.headers["If-None-Match"] = cached.etag
+
+        return cached
+
+    @staticmethod
+    def cacheable(request: httpx.Request, response: httpx.Response) -> bool:
+        # Streams are left alone; buffering them would defeat the point
+        return (
+            request.method == "GET"
+            and response.status_code == 200
+            and "etag" in response.headers
+            and not response.headers.get("content-type", "").startswith(NDJSON_MIMETYPE)
+        )
+
+    @staticmethod
+    def replay(request: httpx.Request, cached: CachedResponse) -> httpx.Response:
+        return httpx.Response(200, headers=cached.headers, content=cached.content, request=request)
+
+
+class DiskResponseCache(ResponseCache):
+    """ResponseCache kept as one file per entry in ``directory``, so it outlives the process.
+
+    The least recently used files beyond ``max_entries`` or ``max_bytes`` are removed. A directory that
+    can't be read or written just means cache misses.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_entries: int = 256, max_bytes: int = 4 * 1024 * 1024
+    ) -> None:
+        super().__init__(max_entries, max_bytes)
+        self.directory = Path(directory)
+
+    def _path(self, request: httpx.Request) -> Path:
+        digest = hashlib.sha256("\n".join(self.key(request)).encode()).hexdigest()
+        return self.directory / digest
+
+    def get(self, request: httpx.Request) -> CachedResponse | None:
+        path = self._path(request)
+
+        try:
+            with path.open("rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+
+            # The modification time orders entries for eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return CachedResponse(etag=meta["etag"], headers=[tuple(h) for h in meta["headers"]], content=content)
+
+    def put(self, request: httpx.Request, response: httpx.Response) -> None:
+        entry = self.entry(response)
+        meta = json.dumps({"etag": entry.etag, "headers": entry.headers}).encode()
+
+        try:
+            if len(entry.content) > self.max_bytes:
+                self._path(request).unlink(missing_ok=True)
+                return
+
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".")
+
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(meta + b"\n" + entry.content)
+
+                os.replace(tmp, self._path(request))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+            with self._lock:
+                self._evict()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        entries = []
+
+        for path in self.directory.iterdir():
+            if path.name.startswith("."):
+                continue
+
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Newest first: keep files while both limits allow
+        entries.sort(reverse=True)
+        size = 0
+
+        for count, (_, file_size, path) in enumerate(entries):
+            size += file_size
+
+            if count >= self.max_entries or size > self.max_bytes:
+                path.unlink(missing_ok=True)
+
+
+class ConditionalTransport(httpx.BaseTransport):
+    """Sync transport that answers unchanged GETs from a local ResponseCache."""
+
+    def __init__(self, transport: httpx.BaseTransport | None = None, cache: ResponseCache | None = None) -> None:
+        self._transport = transport or httpx.HTTPTransport()
+        self.cache = cache or ResponseCache()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cached = self.cache.prepare(request)
+        response = self._transport.handle_request(request)
+
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            return self.cache.replay(request, cached)
+
+        if self.cache.cacheable(request, response):
+            response.read()
+            self.cache.put(request, response)
+
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncConditionalTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ConditionalTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None, cache: ResponseCache | None = None) -> None:
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self.cache = cache or ResponseCache()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cached = self.cache.prepare(request)
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            return self.cache.replay(request, cached)
+
+        if self.cache.cacheable(request, response):
+            await response.aread()
+            self.cache.put(request, response)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
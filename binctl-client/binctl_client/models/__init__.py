@@ -1,19 +1,31 @@
 """Contains all the data models used in inputs/outputs"""
 
 from .node import Node
+from .node_bulk_create import NodeBulkCreate
 from .node_child import NodeChild
 from .node_create import NodeCreate
+from .node_path import NodePath
 from .node_update import NodeUpdate
+from .nodes_move import NodesMove
 from .tag import Tag
 from .tag_create import TagCreate
+from .tag_nodes_update import TagNodesUpdate
+from .tag_ref import TagRef
 from .tag_update import TagUpdate
+from .tree_node import TreeNode
 
 __all__ = (
     "Node",
+    "NodeBulkCreate",
     "NodeChild",
     "NodeCreate",
+    "NodePath",
     "NodeUpdate",
+    "NodesMove",
     "Tag",
     "TagCreate",
+    "TagNodesUpdate",
+    "TagRef",
     "TagUpdate",
+    "TreeNode",
 )
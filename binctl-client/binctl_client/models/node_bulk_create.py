@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+T = TypeVar("T", bound="NodeBulkCreate")
+
+
+@_attrs_define
+class NodeBulkCreate:
+    """
+    Attributes:
+        label (str):
+        ref (str | Unset): Client-side id, echoed back on the created node.
+        description (None | str | Unset):
+        is_container (bool | Unset):  Default: False.
+        parent_id (int | None | Unset):
+        parent_ref (None | str | Unset): The `ref` of an earlier item in the same batch to use as the parent.
+        tag_ids (list[int] | Unset):
+    """
+
+    label: str
+    ref: str | Unset = UNSET
+    description: None | str | Unset = UNSET
+    is_container: bool | Unset = False
+    parent_id: int | None | Unset = UNSET
+    parent_ref: None | str | Unset = UNSET
+    tag_ids: list[int] | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        label = self.label
+
+        ref = self.ref
+
+        description: None | str | Unset
+        if isinstance(self.description, Unset):
+            description = UNSET
+        else:
+            description = self.description
+
+        is_container = self.is_container
+
+        parent_id: int | None | Unset
+        if isinstance(self.parent_id, Unset):
+            parent_id = UNSET
+        else:
+            parent_id = self.parent_id
+
+        parent_ref: None | str | Unset
+        if isinstance(self.parent_ref, Unset):
+            parent_ref = UNSET
+        else:
+            parent_ref = self.parent_ref
+
+        tag_ids: list[int] | Unset = UNSET
+        if not isinstance(self.tag_ids, Unset):
+            tag_ids = self.tag_ids
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "label": label,
+            }
+        )
+        if ref is not UNSET:
+            field_dict["ref"] = ref
+        if description is not UNSET:
+            field_dict["description"] = description
+        if is_container is not UNSET:
+            field_dict["is_container"] = is_container
+        if parent_id is not UNSET:
+            field_dict["parent_id"] = parent_id
+        if parent_ref is not UNSET:
+            field_dict["parent_ref"] = parent_ref
+        if tag_ids is not UNSET:
+            field_dict["tag_ids"] = tag_ids
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        label = d.pop("label")
+
+        ref = d.pop("ref", UNSET)
+
+        def _parse_description(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        description = _parse_description(d.pop("description", UNSET))
+
+        is_container = d.pop("is_container", UNSET)
+
+        def _parse_parent_id(data: object) -> int | None | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(int | None | Unset, data)
+
+        parent_id = _parse_parent_id(d.pop("parent_id", UNSET))
+
+        def _parse_parent_ref(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        parent_ref = _parse_parent_ref(d.pop("parent_ref", UNSET))
+
+        tag_ids = cast(list[int], d.pop("tag_ids", UNSET))
+
+        node_bulk_create = cls(
+            label=label,
+            ref=ref,
+            description=description,
+            is_container=is_container,
+            parent_id=parent_id,
+            parent_ref=parent_ref,
+            tag_ids=tag_ids,
+        )
+
+        node_bulk_create.additional_properties = d
+        return node_bulk_create
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
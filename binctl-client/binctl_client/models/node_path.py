@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.node_child import NodeChild
+
+
+T = TypeVar("T", bound="NodePath")
+
+
+@_attrs_define
+class NodePath:
+    """
+    Attributes:
+        node_id (int):
+        path (list[NodeChild]):
+    """
+
+    node_id: int
+    path: list[NodeChild]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        node_id = self.node_id
+
+        path = []
+        for path_item_data in self.path:
+            path_item = path_item_data.to_dict()
+            path.append(path_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "node_id": node_id,
+                "path": path,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.node_child import NodeChild
+
+        d = dict(src_dict)
+        node_id = d.pop("node_id")
+
+        path = []
+        _path = d.pop("path")
+        for path_item_data in _path:
+            path_item = NodeChild.from_dict(path_item_data)
+
+            path.append(path_item)
+
+        node_path = cls(
+            node_id=node_id,
+            path=path,
+        )
+
+        node_path.additional_properties = d
+        return node_path
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
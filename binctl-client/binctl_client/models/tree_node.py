@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import datetime
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+from dateutil.parser import isoparse
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.tag_ref import TagRef
+
+
+T = TypeVar("T", bound="TreeNode")
+
+
+@_attrs_define
+class TreeNode:
+    """
+    Attributes:
+        id (int):
+        label (str):
+        is_container (bool):
+        created_at (datetime.datetime):
+        updated_at (datetime.datetime):
+        depth (int):
+        description (None | str | Unset):
+        parent_id (int | None | Unset):
+        tags (list[TagRef] | Unset):
+    """
+
+    id: int
+    label: str
+    is_container: bool
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    depth: int
+    description: None | str | Unset = UNSET
+    parent_id: int | None | Unset = UNSET
+    tags: list[TagRef] | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        id = self.id
+
+        label = self.label
+
+        is_container = self.is_container
+
+        created_at = self.created_at.isoformat()
+
+        updated_at = self.updated_at.isoformat()
+
+        depth = self.depth
+
+        description: None | str | Unset
+        if isinstance(self.description, Unset):
+            description = UNSET
+        else:
+            description = self.description
+
+        parent_id: int | None | Unset
+        if isinstance(self.parent_id, Unset):
+            parent_id = UNSET
+        else:
+            parent_id = self.parent_id
+
+        tags: list[dict[str, Any]] | Unset = UNSET
+        if not isinstance(self.tags, Unset):
+            tags = []
+            for tags_item_data in self.tags:
+                tags_item = tags_item_data.to_dict()
+                tags.append(tags_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "id": id,
+                "label": label,
+                "is_container": is_container,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "depth": depth,
+            }
+        )
+        if description is not UNSET:
+            field_dict["description"] = description
+        if parent_id is not UNSET:
+            field_dict["parent_id"] = parent_id
+        if tags is not UNSET:
+            field_dict["tags"] = tags
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.tag_ref import TagRef
+
+        d = dict(src_dict)
+        id = d.pop("id")
+
+        label = d.pop("label")
+
+        is_container = d.pop("is_container")
+
+        created_at = isoparse(d.pop("created_at"))
+
+        updated_at = isoparse(d.pop("updated_at"))
+
+        depth = d.pop("depth")
+
+        def _parse_description(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        description = _parse_description(d.pop("description", UNSET))
+
+        def _parse_parent_id(data: object) -> int | None | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(int | None | Unset, data)
+
+        parent_id = _parse_parent_id(d.pop("parent_id", UNSET))
+
+        _tags = d.pop("tags", UNSET)
+        tags: list[TagRef] | Unset = UNSET
+        if _tags is not UNSET:
+            tags = []
+            for tags_item_data in _tags:
+                tags_item = TagRef.from_dict(tags_item_data)
+
+                tags.append(tags_item)
+
+        tree_node = cls(
+            id=id,
+            label=label,
+            is_container=is_container,
+            created_at=created_at,
+            updated_at=updated_at,
+            depth=depth,
+            description=description,
+            parent_id=parent_id,
+            tags=tags,
+        )
+
+        tree_node.additional_properties = d
+        return tree_node
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
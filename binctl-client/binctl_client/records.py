@@ -0,0 +1,249 @@
+"""Lightweight decoding for large list responses.
+
+Not generated: ``genclient.sh`` restores this file after regenerating the client.
+
+The generated ``Node`` and ``Tag`` models parse both timestamps with ``isoparse`` and carry an
+``additional_properties`` dict each, which dominates the cost of decoding big list pages. The
+functions here fetch the same endpoints but decode each item into a slotted record whose timestamps
+are parsed on first access, or with ``raw=True`` return the decoded JSON as is::
+
+    response = sync_nodes_list(client=client, limit=1000)
+    for node in response.parsed:
+        print(node.id, node.label)
+
+Records have the same attributes as the models (unknown fields are dropped) and the same
+``to_dict()``. ``to_model()`` converts one when the full model is needed.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Callable, Mapping
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+from dateutil.parser import isoparse
+
+from . import errors
+from .api.nodes import get_nodes_list
+from .api.tags import get_tags_list
+from .client import AuthenticatedClient, Client
+from .models.node import Node
+from .models.tag import Tag
+from .types import UNSET, Response, Unset
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return isoparse(value)
+
+
+class _Record:
+    """Base for records: created_at/updated_at are kept as received until first read."""
+
+    __slots__ = ("_created_at", "_updated_at")
+
+    _fields: tuple[str, ...] = ()
+
+    _created_at: str | datetime.datetime
+    _updated_at: str | datetime.datetime
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        if isinstance(self._created_at, str):
+            self._created_at = _parse_datetime(self._created_at)
+
+        return self._created_at
+
+    @property
+    def updated_at(self) -> datetime.datetime:
+        if isinstance(self._updated_at, str):
+            self._updated_at = _parse_datetime(self._updated_at)
+
+        return self._updated_at
+
+    def _timestamps_dict(self) -> dict[str, str]:
+        return {
+            "created_at": self._created_at if isinstance(self._created_at, str) else self._created_at.isoformat(),
+            "updated_at": self._updated_at if isinstance(self._updated_at, str) else self._updated_at.isoformat(),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        field_dict = {name: getattr(self, name) for name in self._fields}
+        field_dict.update(self._timestamps_dict())
+
+        return field_dict
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in (*self._fields, "created_at", "updated_at"))
+        return f"{type(self).__name__}({fields})"
+
+
+class NodeRecord(_Record):
+    """A node from a list response; see ``Node``."""
+
+    __slots__ = ("id", "label", "description", "is_container")
+
+    _fields = ("id", "label", "description", "is_container")
+
+    id: int
+    label: str
+    description: None | str | Unset
+    is_container: bool
+
+    @classmethod
+    def from_dict(cls, src_dict: Mapping[str, Any], strings: dict[str, str] | None = None) -> NodeRecord:
+        """Decodes one list item. Timestamps equal to one already in ``strings`` share its object."""
+        strings = {} if strings is None else strings
+
+        node = cls.__new__(cls)
+        node.id = src_dict["id"]
+        node.label = src_dict["label"]
+        node.description = src_dict.get("description", UNSET)
+        node.is_container = src_dict["is_container"]
+        node._created_at = strings.setdefault(src_dict["created_at"], src_dict["created_at"])
+        node._updated_at = strings.setdefault(src_dict["updated_at"], src_dict["updated_at"])
+
+        return node
+
+    def to_dict(self) -> dict[str, Any]:
+        field_dict = super().to_dict()
+
+        if field_dict["description"] is UNSET:
+            del field_dict["description"]
+
+        return field_dict
+
+    def to_model(self) -> Node:
+        return Node.from_dict(self.to_dict())
+
+
+class TagRecord(_Record):
+    """A tag from a list response; see ``Tag``."""
+
+    __slots__ = ("id", "name")
+
+    _fields = ("id", "name")
+
+    id: int
+    name: str
+
+    @classmethod
+    def from_dict(cls, src_dict: Mapping[str, Any], strings: dict[str, str] | None = None) -> TagRecord:
+        """Decodes one list item. Timestamps equal to one already in ``strings`` share its object."""
+        strings = {} if strings is None else strings
+
+        tag = cls.__new__(cls)
+        tag.id = src_dict["id"]
+        tag.name = src_dict["name"]
+        tag._created_at = strings.setdefault(src_dict["created_at"], src_dict["created_at"])
+        tag._updated_at = strings.setdefault(src_dict["updated_at"], src_dict["updated_at"])
+
+        return tag
+
+    def to_model(self) -> Tag:
+        return Tag.from_dict(self.to_dict())
+
+
+def decode_list(data: list[dict[str, Any]], record: type[_Record]) -> list[Any]:
+    """Decodes a list page into records, sharing repeated timestamps (bulk-created rows) between them."""
+    strings: dict[str, str] = {}
+
+    return [record.from_dict(item, strings) for item in data]
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response, parse: Callable[[Any], Any]
+) -> Response[Any]:
+    if response.status_code == 200:
+        parsed = parse(response.json())
+    elif client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        parsed = None
+
+    # The body isn't kept: for big pages it would outweigh the records
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=b"",
+        headers=response.headers,
+        parsed=parsed,
+    )
+
+
+def _parser(record: type[_Record], raw: bool) -> Callable[[Any], Any]:
+    if raw:
+        return lambda data: data
+
+    return lambda data: decode_list(data, record)
+
+
+def sync_nodes_list(
+    *,
+    client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    raw: bool = False,
+) -> Response[list[NodeRecord]] | Response[list[dict[str, Any]]]:
+    """``get_nodes_list.sync_detailed`` decoding into ``NodeRecord``s, or plain dicts with ``raw=True``.
+
+    Follow ``headers["X-Next-Cursor"]`` for the next page. ``content`` is always empty.
+    """
+    kwargs = get_nodes_list._get_kwargs(limit=limit, after=after)
+    response = client.get_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response, parse=_parser(NodeRecord, raw))
+
+
+async def asyncio_nodes_list(
+    *,
+    client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    raw: bool = False,
+) -> Response[list[NodeRecord]] | Response[list[dict[str, Any]]]:
+    """Async ``sync_nodes_list``."""
+    kwargs = get_nodes_list._get_kwargs(limit=limit, after=after)
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response, parse=_parser(NodeRecord, raw))
+
+
+def sync_tags_list(
+    *,
+    client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    raw: bool = False,
+) -> Response[list[TagRecord]] | Response[list[dict[str, Any]]]:
+    """``get_tags_list.sync_detailed`` decoding into ``TagRecord``s, or plain dicts with ``raw=True``.
+
+    Follow ``headers["X-Next-Cursor"]`` for the next page. ``content`` is always empty.
+    """
+    kwargs = get_tags_list._get_kwargs(limit=limit, after=after)
+    response = client.get_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response, parse=_parser(TagRecord, raw))
+
+
+async def asyncio_tags_list(
+    *,
+    client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    after: str | Unset = UNSET,
+    raw: bool = False,
+) -> Response[list[TagRecord]] | Response[list[dict[str, Any]]]:
+    """Async ``sync_tags_list``."""
+    kwargs = get_tags_list._get_kwargs(limit=limit, after=after)
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response, parse=_parser(TagRecord, raw))
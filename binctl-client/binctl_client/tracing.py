@@ -0,0 +1,134 @@
+"""OpenTelemetry tracing for the generated client.
+
+Not generated: ``genclient.sh`` restores this file after regenerating the client.
+
+Pass one of the transports to a client to wrap every API call in a client span and
+send its ``traceparent`` to the server::
+
+    client = Client(base_url=..., httpx_args={"transport": TracingTransport()})
+
+Needs ``opentelemetry-api``; without it the transports only pass requests through.
+Spans go to the globally configured tracer provider, see :func:`setup_tracing`.
+"""
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:
+    trace = None
+
+
+def setup_tracing(export: str, service_name: str) -> None:
+    """Installs an SDK tracer provider writing finished spans to ``export``.
+
+    ``export`` is ``"console"`` for stderr or a file to append to; an empty string does
+    nothing. Needs ``opentelemetry-sdk``.
+    """
+    if not export or trace is None:
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    out = sys.stderr if export == "console" else open(export, "a")
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter(out=out)))
+    trace.set_tracer_provider(provider)
+
+
+@contextmanager
+def command_span(name: str, started_ns: int | None = None) -> Iterator[Any]:
+    """Wraps a CLI command in a root span.
+
+    With ``started_ns`` (a ``time.time_ns()`` taken as early as possible) the span starts
+    then, and a ``startup`` child span covers the time until this call: interpreter start,
+    imports and configuration. A ``SystemExit`` with a non-zero code marks the span failed.
+    """
+    if trace is None:
+        yield None
+        return
+
+    tracer = trace.get_tracer("binctl_client")
+
+    with tracer.start_as_current_span(
+        name, start_time=started_ns, record_exception=False, set_status_on_exception=False
+    ) as span:
+        if started_ns is not None:
+            tracer.start_span("startup", start_time=started_ns).end()
+
+        try:
+            yield span
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                span.set_status(trace.StatusCode.ERROR, f"exit code {exc.code}")
+            raise
+        except Exception as exc:
+            span.record_exception(exc)
+            span.set_status(trace.StatusCode.ERROR)
+            raise
+
+
+@contextmanager
+def _client_span(request: httpx.Request) -> Iterator[Any]:
+    if trace is None:
+        yield None
+        return
+
+    attributes = {"http.request.method": request.method, "url.full": str(request.url)}
+
+    with trace.get_tracer("binctl_client").start_as_current_span(
+        f"{request.method} {request.url.path}", kind=trace.SpanKind.CLIENT, attributes=attributes
+    ) as span:
+        propagate.inject(request.headers)
+        yield span
+
+
+def _record_response(span: Any, response: httpx.Response) -> None:
+    if span is None:
+        return
+
+    span.set_attribute("http.response.status_code", response.status_code)
+
+    if response.status_code >= 500:
+        span.set_status(trace.StatusCode.ERROR)
+
+
+class TracingTransport(httpx.BaseTransport):
+    """Sync transport that traces each request it sends."""
+
+    def __init__(self, transport: httpx.BaseTransport | None = None) -> None:
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with _client_span(request) as span:
+            response = self._transport.handle_request(request)
+            _record_response(span, response)
+
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncTracingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of TracingTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with _client_span(request) as span:
+            response = await self._transport.handle_async_request(request)
+            _record_response(span, response)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,273 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from flask import g, has_app_context
+
+from metrics import count_cache_lookup
+
+# Configuration
+CACHE_URL = os.environ.get('CACHE_URL', 'memory://')
+CACHE_TTL = float(os.environ.get('CACHE_TTL', 30))
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+CACHE_TIMEOUT = float(os.environ.get('CACHE_TIMEOUT', 0.5))
+
+logger = logging.getLogger('binctl.cache')
+
+_cache = None
+_cache_pid = None
+_cache_lock = threading.Lock()
+
+# (version_func, version) of the response being built, set by web.etag()
+_data_version = ContextVar('data_version', default=None)
+
+
+class NullCache:
+    """
+    Cache that never stores anything. Used when CACHE_URL is 'none'.
+    """
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def delete(self, *keys):
+        pass
+
+
+class MemoryCache:
+    """
+    In-process LRU cache with a per-entry TTL. Each worker process has its
+    own copy, so invalidations in one worker don't reach the others; entries
+    are checked against the data version before use (see cached()).
+    """
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires, value = entry
+
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class RedisCache:
+    """
+    Cache shared by all workers through a Redis-protocol server.
+    Values are stored as JSON.
+
+    The cache is not a hard dependency: when the server is down or slower
+    than CACHE_TIMEOUT, reads are misses and writes are skipped (and
+    logged). A missed delete can't serve stale data, since entries are
+    checked against the data version before use (see cached()).
+    """
+
+    def __init__(self, url, ttl=CACHE_TTL, timeout=CACHE_TIMEOUT):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(f'CACHE_URL is {url} but the redis package is not installed') from None
+
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        self._errors = redis.RedisError
+
+    def get(self, key):
+        try:
+            value = self._client.get(key)
+        except self._errors as e:
+            logger.warning('Cache read of %s failed: %s', key, e)
+            return None
+
+        if value is None:
+            return None
+
+        return json.loads(value)
+
+    def set(self, key, value):
+        try:
+            self._client.set(key, json.dumps(value), px=int(self.ttl * 1000))
+        except self._errors as e:
+            logger.warning('Cache write of %s failed: %s', key, e)
+
+    def delete(self, *keys):
+        if not keys:
+            return
+
+        try:
+            self._client.delete(*keys)
+        except self._errors as e:
+            logger.warning('Cache delete of %s failed: %s', ', '.join(keys), e)
+
+
+def get_cache():
+    """
+    Returns the process-wide cache backend selected by CACHE_URL:
+    'memory://' (default), 'none', or a redis:// / rediss:// / unix:// URL.
+    """
+    global _cache, _cache_pid
+
+    if _cache is not None and _cache_pid == os.getpid():
+        return _cache
+
+    with _cache_lock:
+        if _cache is None or _cache_pid != os.getpid():
+            if CACHE_URL in ('', 'none'):
+                _cache = NullCache()
+            elif CACHE_URL.startswith('memory://'):
+                _cache = MemoryCache()
+            else:
+                _cache = RedisCache(CACHE_URL)
+
+            _cache_pid = os.getpid()
+
+    return _cache
+
+
+def node_key(node_id):
+    return f'node:{node_id}'
+
+
+def tag_key(tag_id):
+    return f'tag:{tag_id}'
+
+
+@contextmanager
+def data_version(version_func, version):
+    """
+    Declares that, inside the block, the data described by version_func is
+    at version. web.etag() wraps its handler in this so cached() can check
+    entries against the version the ETag was derived from.
+    """
+    token = _data_version.set((version_func, version))
+
+    try:
+        yield
+    finally:
+        _data_version.reset(token)
+
+
+def current_version(version_func):
+    """
+    The version declared by data_version() for version_func, as a list (the
+    form it is cached in), or None if none was declared.
+    """
+    declared = _data_version.get()
+
+    if declared is None or declared[0] is not version_func:
+        return None
+
+    return list(declared[1])
+
+
+def cached_value(entry, version):
+    """
+    The value of a cache entry stored by cached(), or None if it is missing
+    or was built at a different version than the one being served.
+    """
+    if entry is None or entry[0] != version:
+        return None
+
+    return entry[1]
+
+
+def cached(key_func, version_func):
+    """
+    Caches the (JSON-serialisable) result of a fetch helper under
+    key_func(*args), together with the version_func(*args) version it was
+    built at. An entry is only used when that matches the version declared
+    by data_version(), so a worker that missed an invalidation can't pair a
+    fresh ETag with an old body. Without a declared version the cache is
+    bypassed. None results and results read from a replica are not cached.
+    Cached values are shared between requests and must not be mutated by
+    the caller.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            version = current_version(version_func)
+
+            if version is None:
+                return func(*args)
+
+            cache = get_cache()
+            key = key_func(*args)
+            value = cached_value(cache.get(key), version)
+            count_cache_lookup(key, value is not None)
+
+            if value is None:
+                value = func(*args)
+
+                # A lagging replica could put back what a write just invalidated
+                if value is not None and not (has_app_context() and g.get('db_replica')):
+                    cache.set(key, [version, value])
+
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*keys):
+    """
+    Drops keys from the cache now and again when the request ends, so a
+    concurrent reader can't put back data from before the commit.
+    """
+    keys = [key for key in keys if key is not None]
+
+    if not keys:
+        return
+
+    get_cache().delete(*keys)
+
+    if has_app_context():
+        g.setdefault('cache_invalidate', set()).update(keys)
+
+
+def flush_invalidations(exc=None):
+    """
+    Teardown handler that repeats the request's invalidations after its
+    transaction has been committed or rolled back.
+    """
+    keys = g.pop('cache_invalidate', None)
+
+    if keys:
+        get_cache().delete(*keys)
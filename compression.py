@@ -0,0 +1,202 @@
+import os
+import zlib
+
+from flask import request
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Configuration
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 5))
+COMPRESS_ZSTD_LEVEL = int(os.environ.get('COMPRESS_ZSTD_LEVEL', 3))
+COMPRESS_FLUSH_SIZE = int(os.environ.get('COMPRESS_FLUSH_SIZE', 16 * 1024))
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/problem+json', 'application/x-ndjson')
+
+
+def _gzip():
+    compressor = zlib.compressobj(COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31: gzip container
+
+    return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def _brotli():
+    compressor = brotli.Compressor(quality=COMPRESS_BROTLI_QUALITY)
+
+    return compressor.process, compressor.flush, compressor.finish
+
+
+def _zstd():
+    compressor = zstandard.ZstdCompressor(level=COMPRESS_ZSTD_LEVEL).compressobj()
+
+    return compressor.compress, lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK), compressor.flush
+
+
+# Server preference, best first; only codings whose library is installed.
+# Each factory returns (compress, flush, finish) for a new compressor.
+ENCODINGS = {}
+
+if zstandard is not None:
+    ENCODINGS['zstd'] = _zstd
+
+if brotli is not None:
+    ENCODINGS['br'] = _brotli
+
+ENCODINGS['gzip'] = _gzip
+
+
+def negotiate_encoding(accept_encoding=None):
+    """
+    Returns the content coding to use for this request's response, or
+    None for identity. The client's q-values win; ties go to ENCODINGS order.
+    Outside a Flask request, pass the Accept-Encoding header value.
+    """
+    if accept_encoding is None:
+        accepted = request.accept_encodings
+    else:
+        accepted = parse_accept_header(accept_encoding)
+
+    return accepted.best_match(list(ENCODINGS))
+
+
+def compress_stream(chunks, encoding):
+    """
+    Compresses an iterable of str/bytes chunks lazily. The compressor is
+    flushed after the chunk that brings the input since the last flush to
+    COMPRESS_FLUSH_SIZE bytes, so long NDJSON streams reach the client as
+    they are generated instead of sitting in the compressor's buffer.
+    """
+    compress, flush, finish = ENCODINGS[encoding]()
+    pending = 0
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+
+        data = compress(chunk)
+        pending += len(chunk)
+
+        if pending >= COMPRESS_FLUSH_SIZE:
+            data += flush()
+            pending = 0
+
+        if data:
+            yield data
+
+    yield finish()
+
+
+def compress_response(resp):
+    """
+    after_request hook that compresses JSON and NDJSON responses with the
+    negotiated coding. Buffered bodies smaller than COMPRESS_MIN_SIZE are
+    sent as they are; streamed bodies are always compressed.
+    """
+    if resp.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return resp
+
+    resp.vary.add('Accept-Encoding')
+
+    if resp.status_code != 200 or 'Content-Encoding' in resp.headers:
+        return resp
+
+    encoding = negotiate_encoding()
+
+    if encoding is None:
+        return resp
+
+    if resp.is_streamed:
+        resp.response = compress_stream(resp.response, encoding)
+        resp.headers.pop('Content-Length', None)
+    else:
+        data = resp.get_data()
+
+        if len(data) < COMPRESS_MIN_SIZE:
+            return resp
+
+        resp.set_data(b''.join(compress_stream([data], encoding)))
+
+    resp.headers['Content-Encoding'] = encoding
+
+    return resp
+
+
+class CompressionMiddleware:
+    """
+    ASGI counterpart of compress_response() for apps served without Flask
+    (see routes_async). Same negotiation, threshold and streaming rules.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        request_headers = Headers([(k.decode('latin-1'), v.decode('latin-1')) for k, v in scope['headers']])
+        encoding = negotiate_encoding(request_headers.get('Accept-Encoding', ''))
+        start = None
+        compress = flush = finish = None
+        pending = 0
+
+        async def send_compressed(message):
+            nonlocal start, compress, flush, finish, pending
+
+            if message['type'] == 'http.response.start':
+                start = message  # Held back until we've seen the first body chunk
+                return
+
+            if message['type'] != 'http.response.body':
+                return await send(message)
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+            if start is not None:
+                headers = Headers([(k.decode('latin-1'), v.decode('latin-1')) for k, v in start['headers']])
+                mimetype = headers.get('Content-Type', '').split(';')[0].strip()
+
+                if mimetype in COMPRESSIBLE_MIMETYPES:
+                    headers.add('Vary', 'Accept-Encoding')
+
+                    if (
+                        start['status'] == 200
+                        and encoding is not None
+                        and 'Content-Encoding' not in headers
+                        and (more_body or len(body) >= COMPRESS_MIN_SIZE)
+                    ):
+                        compress, flush, finish = ENCODINGS[encoding]()
+                        headers['Content-Encoding'] = encoding
+                        headers.pop('Content-Length', None)
+
+                start['headers'] = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in headers.items()]
+                await send(start)
+                start = None
+
+            if compress is None:
+                return await send(message)
+
+            data = compress(body)
+            pending += len(body)
+
+            if not more_body:
+                data += finish()
+            elif pending >= COMPRESS_FLUSH_SIZE:
+                data += flush()
+                pending = 0
+
+            await send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+
+        await self.app(scope, receive, send_compressed)
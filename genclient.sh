@@ -1 +1,5 @@
 openapi-python-client generate --path openapi.yaml --overwrite
+
+# Hand-written modules the generator doesn't know about
+git checkout -- binctl-client/binctl_client/conditional.py binctl-client/binctl_client/tracing.py \
+    binctl-client/binctl_client/records.py
@@ -0,0 +1,23 @@
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+
+# gunicorn's maximum, up from 4094: GET /v1/nodes/paths puts up to 250 ids
+# (int64, up to 19 digits each) in the query string
+limit_request_line = 8190
+
+if os.environ.get('GUNICORN_ASGI', 'false').lower() in ('1', 'true', 'yes', 'on'):
+    # Serve connexion's ASGI stack directly; handlers run in its thread pool
+    worker_class = 'uvicorn_worker.UvicornWorker'
+    wsgi_app = 'web:create_asgi_app()'
+else:
+    threads = int(os.environ.get('GUNICORN_THREADS', 4))
+    wsgi_app = 'web:create_app()'
+
+
+def post_fork(server, worker):
+    # Each worker needs its own pool; sockets inherited from the master are unusable.
+    from db import reset_engine
+
+    reset_engine()
@@ -0,0 +1,87 @@
+import json
+import logging
+import os
+import time
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+
+# Configuration
+SERVER_TIMING = os.environ.get('SERVER_TIMING', 'true').lower() in ('1', 'true', 'yes', 'on')
+SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS', 500))
+REQUEST_LOG_LEVEL = os.environ.get('REQUEST_LOG_LEVEL', 'INFO').upper()
+
+# One JSON line per request at INFO, plus the statements of slow requests at
+# WARNING. Gets its own stderr handler unless logging is configured already.
+logger = logging.getLogger('binctl.requests')
+logger.setLevel(REQUEST_LOG_LEVEL)
+
+if not logger.hasHandlers():
+    logger.addHandler(logging.StreamHandler())
+
+
+def instrument_engine(engine):
+    """
+    Records the duration and row count of every statement run on engine
+    inside a Flask request in g.sql_queries, for log_request() to report.
+    """
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_started'] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop('query_started', None)
+
+    if started is None or not has_app_context():
+        return
+
+    # rowcount is -1 when the driver can't tell, e.g. for server-side cursors
+    g.setdefault('sql_queries', []).append((statement, time.perf_counter() - started, max(cursor.rowcount, 0)))
+
+
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+def log_request(resp):
+    """
+    after_request hook that reports the request's SQL work: query count,
+    total DB time and rows as a Server-Timing header and a log line. The
+    statements of requests slower than SLOW_REQUEST_MS are logged too.
+    Queries run while a streamed body is being sent come after this hook
+    and aren't counted.
+    """
+    queries = g.pop('sql_queries', [])
+    total_ms = (time.perf_counter() - g.get('request_started', time.perf_counter())) * 1000
+    db_ms = sum(duration for _, duration, _ in queries) * 1000
+    rows = sum(count for _, _, count in queries)
+
+    if SERVER_TIMING:
+        resp.headers.add('Server-Timing', f'db;desc="{len(queries)} queries, {rows} rows";dur={db_ms:.1f}')
+        resp.headers.add('Server-Timing', f'app;dur={total_ms:.1f}')
+
+    record = {
+        'method': request.method,
+        'path': request.path,
+        'endpoint': request.endpoint,
+        'status': resp.status_code,
+        'duration_ms': round(total_ms, 1),
+        'db_ms': round(db_ms, 1),
+        'queries': len(queries),
+        'rows': rows,
+    }
+
+    if 0 <= SLOW_REQUEST_MS <= total_ms:
+        record['statements'] = [
+            {'sql': ' '.join(statement.split()), 'ms': round(duration * 1000, 1), 'rows': count}
+            for statement, duration, count in queries
+        ]
+        logger.warning(json.dumps(record))
+    else:
+        logger.info(json.dumps(record))
+
+    return resp
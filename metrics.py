@@ -0,0 +1,213 @@
+import bisect
+import threading
+import time
+
+from connexion.context import operation
+from flask import Response, g, request
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Counter:
+    """
+    Monotonic counter with a fixed set of label names, e.g.
+    requests.inc('get_node_detail', '200').
+    """
+
+    type = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+
+        for label_values, value in sorted(values.items()):
+            yield self.name, dict(zip(self.labels, label_values)), value
+
+
+class Histogram:
+    """
+    Cumulative histogram over fixed bucket upper bounds, as Prometheus
+    expects: one _bucket series per bound plus +Inf, _sum and _count.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self._values = {}  # label values -> ([count per bucket and +Inf], sum)
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            counts, total = self._values.get(label_values, ([0] * (len(self.buckets) + 1), 0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[label_values] = (counts, total + value)
+
+    def samples(self):
+        with self._lock:
+            values = {k: (list(counts), total) for k, (counts, total) in self._values.items()}
+
+        for label_values, (counts, total) in sorted(values.items()):
+            labels = dict(zip(self.labels, label_values))
+            cumulative = 0
+
+            for bound, count in zip([*self.buckets, '+Inf'], counts):
+                cumulative += count
+                yield f'{self.name}_bucket', dict(labels, le=str(bound)), cumulative
+
+            yield f'{self.name}_sum', labels, total
+            yield f'{self.name}_count', labels, cumulative
+
+
+REQUESTS = Counter('binctl_http_requests_total', 'HTTP requests handled', ('operation', 'method', 'status'))
+REQUEST_DURATION = Histogram(
+    'binctl_http_request_duration_seconds', 'Time spent handling a request', ('operation',), DURATION_BUCKETS
+)
+RESPONSE_SIZE = Histogram(
+    'binctl_http_response_size_bytes',
+    'Size of buffered response bodies, after compression',
+    ('operation',),
+    SIZE_BUCKETS,
+)
+CACHE_LOOKUPS = Counter('binctl_cache_lookups_total', 'Response cache lookups', ('kind', 'result'))
+
+METRICS = [REQUESTS, REQUEST_DURATION, RESPONSE_SIZE, CACHE_LOOKUPS]
+
+
+def count_cache_lookup(key, hit):
+    # Keys look like 'node:12'; the kind keeps the label set small
+    CACHE_LOOKUPS.inc(key.partition(':')[0], 'hit' if hit else 'miss')
+
+
+def observe_request(operation_id, method, status, duration, size=None):
+    REQUESTS.inc(operation_id, method, str(status))
+    REQUEST_DURATION.observe(duration, operation_id)
+
+    if size is not None:
+        RESPONSE_SIZE.observe(size, operation_id)
+
+
+def current_operation_id():
+    """
+    The operationId from openapi.yaml of the operation being served, or
+    None outside an API operation (e.g. /metrics itself).
+    """
+    try:
+        # Resolved ids carry the controller module: 'routes.get_node_detail'
+        return operation.operation_id.rpartition('.')[2]
+    except (LookupError, RuntimeError):
+        return None
+
+
+def record_request(resp):
+    """
+    after_request hook that counts the request and observes its duration
+    and, for buffered bodies, its size as sent.
+    """
+    operation_id = current_operation_id()
+
+    if operation_id is not None:
+        duration = time.perf_counter() - g.get('request_started', time.perf_counter())
+        size = None if resp.is_streamed else resp.content_length
+        observe_request(operation_id, request.method, resp.status_code, duration, size)
+
+    return resp
+
+
+async def measure_asgi(app, operation_id, scope, receive, send):
+    """
+    Calls an ASGI app, measuring it like record_request() measures a Flask
+    request: up to the response headers, with the size of unstreamed bodies.
+    """
+    started = time.perf_counter()
+    status = duration = None
+    size = 0
+    streamed = False
+
+    async def send_measured(message):
+        nonlocal status, duration, size, streamed
+
+        if message['type'] == 'http.response.start':
+            status = message['status']
+            duration = time.perf_counter() - started
+        elif message['type'] == 'http.response.body':
+            size += len(message.get('body', b''))
+
+            if message.get('more_body', False):
+                streamed = True
+            else:
+                observe_request(operation_id, scope['method'], status, duration, None if streamed else size)
+
+        await send(message)
+
+    await app(scope, receive, send_measured)
+
+
+def pool_gauges():
+    from db import DATABASE_READ_URLS, pool_stats
+
+    stats = pool_stats()
+    pools = [('primary', stats)]
+    pools += [(f'replica{i}', replica) for i, replica in enumerate(stats.get('replicas', []))]
+
+    for name, key, help in (
+        ('binctl_db_pool_size', 'size', 'Connections the pool keeps open'),
+        ('binctl_db_pool_checked_out', 'checked_out', 'Connections currently in use'),
+        ('binctl_db_pool_overflow', 'overflow', 'Connections open above the pool size (negative while filling)'),
+    ):
+        yield name, help, 'gauge', [(name, {'pool': pool}, values[key]) for pool, values in pools]
+
+    if DATABASE_READ_URLS:
+        yield (
+            'binctl_db_replica_lag_seconds',
+            'Last measured replication lag, NaN if unknown',
+            'gauge',
+            [
+                (
+                    'binctl_db_replica_lag_seconds',
+                    {'pool': pool},
+                    float('nan') if values['lag'] is None else values['lag'],
+                )
+                for pool, values in pools[1:]
+            ],
+        )
+
+
+def render():
+    """
+    Returns all metrics in the Prometheus text exposition format.
+    """
+    families = [(m.name, m.help, m.type, list(m.samples())) for m in METRICS]
+    families += pool_gauges()
+    lines = []
+
+    for name, help, type_, samples in families:
+        lines.append(f'# HELP {name} {help}')
+        lines.append(f'# TYPE {name} {type_}')
+
+        for sample_name, labels, value in samples:
+            label_text = ','.join(f'{k}="{v}"' for k, v in labels.items())
+            lines.append(f'{sample_name}{{{label_text}}} {value}' if labels else f'{sample_name} {value}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_endpoint():
+    return Response(render(), content_type=CONTENT_TYPE)
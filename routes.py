@@ -1,82 +1,91 @@
+import itertools
+from functools import partial
+
 from flask import jsonify, request
-from sqlalchemy import text
+from sqlalchemy import Boolean, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from db import (
+    bulk_create_nodes,
+    decode_cursor,
     ensure_parent_is_valid,
-    fetch_children,
     fetch_node,
-    fetch_parent_id,
-    fetch_tags_for_node,
+    fetch_node_detail,
+    fetch_paths,
+    fetch_subtree,
+    fetch_tag,
+    fetch_tag_detail,
     get_db,
-    iso,
-    node_row_to_dict,
+    init_closure,
+    invalidate_node,
+    invalidate_tag,
+    move_nodes,
+    node_detail_version,
+    node_rows,
+    nodes_page_query,
+    page_version,
+    paths_version,
     replace_node_tags,
     set_parent,
+    split_page,
+    stream_rows,
+    stream_subtree,
+    subtree_version,
+    tag_detail_version,
+    tag_nodes_query,
+    tag_row_to_dict,
+    tag_rows,
+    tags_page_query,
+    update_tag_nodes,
+    walk_tree,
 )
-from web import error
+from web import error, etag, ndjson_response, wants_ndjson
 
 
 # Tag endpoints
-def get_tags_list():
-    db = get_db()
-    stmt = text(
-        """
-        SELECT id, name, created_at, updated_at
-        FROM tags
-        ORDER BY name
-        """
-    )
-    rows = db.execute(stmt).mappings().all()
+@etag(partial(page_version, 'tags', 'name'))
+def get_tags_list(limit=None, after=None, stream=False):
+    if after is not None:
+        try:
+            after = decode_cursor(after, 'name')
+        except ValueError as ve:
+            return error(400, str(ve))
 
-    return jsonify(
-        [
-            {
-                'id': r['id'],
-                'name': r['name'],
-                'created_at': iso(r['created_at']),
-                'updated_at': iso(r['updated_at']),
-            }
-            for r in rows
-        ]
-    )
+    if wants_ndjson(stream):
+        return ndjson_response(tag_rows(stream_rows(tags_page_query, 'name', after, limit)))
 
+    # One extra row tells us whether there is a next page
+    stmt, params = tags_page_query(after, None if limit is None else limit + 1)
+    rows = get_db().execute(stmt, params).mappings().all()
+    rows, next_cursor = split_page(rows, limit, 'name')
 
-def get_tag_detail(tag_id):
-    db = get_db()
-    tag_stmt = text(
-        """
-        SELECT id, name, created_at, updated_at
-        FROM tags
-        WHERE id = :id
-        """
-    )
-    tag = db.execute(tag_stmt, {'id': tag_id}).mappings().first()
+    resp = jsonify(list(tag_rows(rows)))
+
+    if next_cursor:
+        resp.headers['X-Next-Cursor'] = next_cursor
+
+    return resp
+
+
+@etag(tag_detail_version)
+def get_tag_detail(tag_id, stream=False):
+    if wants_ndjson(stream):
+        tag = fetch_tag(tag_id)
+
+        if not tag:
+            return error(404, 'Tag not found')
+
+        # The tag itself comes first, followed by one line per node
+        nodes = stream_rows(partial(tag_nodes_query, tag_id), 'id')
+
+        return ndjson_response(itertools.chain([tag_row_to_dict(tag)], node_rows(nodes)))
+
+    tag = fetch_tag_detail(tag_id)
 
     if not tag:
         return error(404, 'Tag not found')
 
-    nodes_stmt = text(
-        """
-        SELECT n.id, n.label, n.description, n.is_container,
-               n.created_at, n.updated_at
-        FROM tag_node tn
-        JOIN nodes n ON n.id = tn.node_id
-        WHERE tn.tag_id = :id
-        ORDER BY n.id
-        """
-    )
-    nodes = db.execute(nodes_stmt, {'id': tag_id}).mappings().all()
-
-    return jsonify(
-        {
-            'id': tag['id'],
-            'name': tag['name'],
-            'created_at': iso(tag['created_at']),
-            'updated_at': iso(tag['updated_at']),
-            'nodes': [node_row_to_dict(n) for n in nodes],
-        }
-    )
+    return jsonify(tag)
 
 
 def post_tag_create():
@@ -120,14 +129,7 @@ def post_tag_create():
         .first()
     )
 
-    resp = jsonify(
-        {
-            'id': tag['id'],
-            'name': tag['name'],
-            'created_at': iso(tag['created_at']),
-            'updated_at': iso(tag['updated_at']),
-        }
-    )
+    resp = jsonify(tag_row_to_dict(tag))
     resp.status_code = 201
 
     return resp
@@ -156,6 +158,8 @@ def post_tag_update(tag_id):
         db.rollback()
         return error(404, 'Tag not found')
 
+    invalidate_tag(tag_id)
+
     try:
         db.commit()
 
@@ -178,47 +182,103 @@ def post_tag_update(tag_id):
         .first()
     )
 
-    return jsonify(
-        {
-            'id': tag['id'],
-            'name': tag['name'],
-            'created_at': iso(tag['created_at']),
-            'updated_at': iso(tag['updated_at']),
-        }
-    )
+    return jsonify(tag_row_to_dict(tag))
 
 
-# Node endpoints
-def get_nodes_list():
+def post_tag_nodes_update(tag_id):
     db = get_db()
-    stmt = text(
-        """
-        SELECT id, label, description, is_container, created_at, updated_at
-        FROM nodes
-        ORDER BY id
-        """
-    )
-    rows = db.execute(stmt).mappings().all()
+    data = request.get_json(silent=True) or {}
+
+    if not fetch_tag(tag_id):
+        return error(404, 'Tag not found')
+
+    try:
+        update_tag_nodes(tag_id, add=data.get('add') or [], remove=data.get('remove') or [])
+
+        db.commit()
+
+    except ValueError as ve:
+        db.rollback()
+        return error(400, str(ve))
+
+    except SQLAlchemyError as se:
+        db.rollback()
+        return error(500, f'Database error: {se}')
+
+    return jsonify(tag_row_to_dict(fetch_tag(tag_id)))
+
+
+# Node endpoints
+@etag(partial(page_version, 'nodes', 'id'))
+def get_nodes_list(limit=None, after=None, stream=False):
+    if after is not None:
+        try:
+            after = decode_cursor(after, 'id')
+        except ValueError as ve:
+            return error(400, str(ve))
+
+    if wants_ndjson(stream):
+        return ndjson_response(node_rows(stream_rows(nodes_page_query, 'id', after, limit)))
+
+    # One extra row tells us whether there is a next page
+    stmt, params = nodes_page_query(after, None if limit is None else limit + 1)
+    rows = get_db().execute(stmt, params).mappings().all()
+    rows, next_cursor = split_page(rows, limit, 'id')
 
-    return jsonify([node_row_to_dict(r) for r in rows])
+    resp = jsonify(list(node_rows(rows)))
 
+    if next_cursor:
+        resp.headers['X-Next-Cursor'] = next_cursor
 
+    return resp
+
+
+@etag(node_detail_version)
 def get_node_detail(node_id):
-    row = fetch_node(node_id)
+    node = fetch_node_detail(node_id)
 
-    if not row:
+    if not node:
         return error(404, 'Node not found')
 
-    parent_id = fetch_parent_id(node_id)
-    children = fetch_children(node_id)
-    tags = fetch_tags_for_node(node_id)
+    return jsonify(node)
 
-    node = node_row_to_dict(row)
-    node['parent_id'] = parent_id
-    node['children'] = children
-    node['tags'] = tags
 
-    return jsonify(node)
+@etag(lambda node_id: paths_version([node_id]))
+def get_node_path(node_id):
+    paths = fetch_paths([node_id])
+
+    if node_id not in paths:
+        return error(404, 'Node not found')
+
+    return jsonify(paths[node_id])
+
+
+@etag(paths_version)
+def get_nodes_paths(node_ids):
+    paths = fetch_paths(node_ids)
+
+    # Keep the caller's order, dropping duplicates and unknown ids
+    return jsonify([{'node_id': i, 'path': paths[i]} for i in dict.fromkeys(node_ids) if i in paths])
+
+
+@etag(subtree_version)
+def get_node_tree(node_id, max_depth=None, include_tags=False, stream=False):
+    if wants_ndjson(stream):
+        # Level by level: depth-first order would need the whole subtree first
+        nodes = stream_subtree(node_id, max_depth=max_depth, include_tags=include_tags)
+        root = next(nodes, None)
+
+        if root is None:
+            return error(404, 'Node not found')
+
+        return ndjson_response(itertools.chain([root], nodes))
+
+    nodes = fetch_subtree(node_id, max_depth=max_depth, include_tags=include_tags)
+
+    if not nodes:
+        return error(404, 'Node not found')
+
+    return jsonify(list(walk_tree(nodes)))
 
 
 def post_node_create():
@@ -253,6 +313,7 @@ def post_node_create():
             },
         )
         node_id = result.lastrowid
+        init_closure(node_id)
 
         # Parent relationship
         if parent_id is not None:
@@ -273,15 +334,7 @@ def post_node_create():
         return error(500, f'Database error: {se}')
 
     # Fetch full node representation
-    row = fetch_node(node_id)
-    parent_id = fetch_parent_id(node_id)
-    children = fetch_children(node_id)
-    tags = fetch_tags_for_node(node_id)
-
-    node = node_row_to_dict(row)
-    node['parent_id'] = parent_id
-    node['children'] = children
-    node['tags'] = tags
+    node = fetch_node_detail(node_id)
 
     resp = jsonify(node)
     resp.status_code = 201
@@ -289,6 +342,63 @@ def post_node_create():
     return resp
 
 
+def post_nodes_bulk_create():
+    db = get_db()
+    items = request.get_json(silent=True) or []
+
+    if not items:
+        return error(400, 'Expected a non-empty array of nodes')
+
+    try:
+        nodes = bulk_create_nodes(items)
+
+        db.commit()
+
+    except ValueError as ve:
+        db.rollback()
+        return error(400, str(ve))
+
+    except SQLAlchemyError as se:
+        db.rollback()
+        return error(500, f'Database error: {se}')
+
+    resp = jsonify(nodes)
+    resp.status_code = 201
+
+    return resp
+
+
+def post_nodes_move():
+    db = get_db()
+    data = request.get_json(silent=True) or {}
+    node_ids = list(dict.fromkeys(data.get('node_ids') or []))
+    parent_id = data.get('parent_id')
+
+    if not node_ids:
+        return error(400, 'Missing required field: node_ids')
+
+    if parent_id is not None:
+        if err := ensure_parent_is_valid(parent_id):
+            return err
+
+    try:
+        move_nodes(node_ids, parent_id)
+
+        db.commit()
+
+    except ValueError as ve:
+        db.rollback()
+        return error(400, str(ve))
+
+    except SQLAlchemyError as se:
+        db.rollback()
+        return error(500, f'Database error: {se}')
+
+    paths = fetch_paths(node_ids)
+
+    return jsonify([{'node_id': i, 'path': paths[i]} for i in node_ids])
+
+
 def post_node_update(node_id):
     db = get_db()
     data = request.get_json(silent=True) or {}
@@ -315,11 +425,13 @@ def post_node_update(node_id):
     tag_ids_provided = 'tag_ids' in data
     tag_ids = data.get('tag_ids') or []
 
-    if parent_provided and parent_id is not None:
-        if err := ensure_parent_is_valid(parent_id, child_id=node_id):
-            return err
-
     try:
+        # Locks the tree against concurrent moves until the commit
+        if parent_provided and parent_id is not None:
+            if err := ensure_parent_is_valid(parent_id, child_id=node_id):
+                db.rollback()
+                return err
+
         # Update node core fields
         if fields:
             sets = ', '.join(f'{k} = :{k}' for k in fields.keys())
@@ -333,6 +445,7 @@ def post_node_update(node_id):
                 """
             )
             db.execute(stmt, params)
+            invalidate_node(node_id)
 
         # Parent relationship
         if parent_provided:
@@ -355,14 +468,6 @@ def post_node_update(node_id):
         return error(500, f'Database error: {se}')
 
     # Return updated representation
-    row = fetch_node(node_id)
-    parent_id = fetch_parent_id(node_id)
-    children = fetch_children(node_id)
-    tags = fetch_tags_for_node(node_id)
-
-    node = node_row_to_dict(row)
-    node['parent_id'] = parent_id
-    node['children'] = children
-    node['tags'] = tags
+    node = fetch_node_detail(node_id)
 
     return jsonify(node)
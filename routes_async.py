@@ -0,0 +1,226 @@
+from functools import partial, wraps
+
+from connexion import request
+from starlette.responses import Response, StreamingResponse
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_etags
+
+import db_async
+from cache import data_version
+from compression import negotiate_encoding
+from db import (
+    decode_cursor,
+    node_row_to_dict,
+    node_rows,
+    nodes_page_query,
+    split_page,
+    tag_nodes_query,
+    tag_row_to_dict,
+    tag_rows,
+    tags_page_query,
+    walk_tree,
+)
+from web import FAST_JSON, NDJSON_MIMETYPE, json_bytes, make_etag
+
+# Read endpoints served by the AsyncApp from web.create_asgi_app() when
+# ASYNC_DATABASE_URL is set. Responses match their counterparts in routes.
+OPERATIONS = {
+    'get_tags_list',
+    'get_tag_detail',
+    'get_nodes_list',
+    'get_node_detail',
+    'get_node_path',
+    'get_nodes_paths',
+    'get_node_tree',
+}
+
+
+def json_response(data, status=200):
+    return Response(json_bytes(data), status_code=status, media_type='application/json')
+
+
+def error(status, message):
+    return json_response({'error': message}, status)
+
+
+def ndjson_response(items, head=(), row_to_dict=None):
+    """
+    Async web.ndjson_response(): streams the items in head, then those of
+    the async iterable items, one per line. Rows in items go through
+    row_to_dict when orjson can't serialise them itself (see db.node_rows).
+    """
+    convert = None if FAST_JSON else row_to_dict
+
+    async def lines():
+        for item in head:
+            yield json_bytes(item)
+
+        async for item in items:
+            yield json_bytes(convert(item) if convert else item)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MIMETYPE)
+
+
+def wants_ndjson(stream=False):
+    if stream:
+        return True
+
+    accept = parse_accept_header(request.headers.get('Accept', ''), MIMEAccept)
+
+    return accept.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def etag(version_func):
+    """
+    Async web.etag(); produces the same tags for the same data.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(*args, **kwargs):
+            version = await version_func(*args, **kwargs)
+
+            if version is None:
+                return await view(*args, **kwargs)
+
+            full_path = f'{request.url.path}?{request.url.query}'
+            encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''))
+            tag = make_etag(full_path, wants_ndjson(), encoding, version)
+
+            if parse_etags(request.headers.get('If-None-Match')).contains(tag):
+                resp = Response(status_code=304)
+            else:
+                with data_version(version_func, version):
+                    resp = await view(*args, **kwargs)
+
+                if resp.status_code != 200:
+                    return resp
+
+            resp.headers['ETag'] = f'"{tag}"'
+            resp.headers.append('Vary', 'Accept')
+
+            # The tag depends on the coding too. CompressionMiddleware adds this
+            # to the 200, but skips the body-less 304 that validates it
+            if resp.status_code == 304:
+                resp.headers.append('Vary', 'Accept-Encoding')
+
+            return resp
+
+        return wrapper
+
+    return decorator
+
+
+def page_version(table, key):
+    """
+    Version function for a list handler, like partial(db.page_version, ...)
+    in routes.
+    """
+
+    async def version(limit=None, after=None, stream=False):
+        return await db_async.page_version(table, key, limit, after, wants_ndjson(stream))
+
+    return version
+
+
+async def list_page(query, key, rows_func, row_to_dict, limit, after, stream):
+    """
+    The body of get_tags_list/get_nodes_list in routes, for any list.
+    """
+    if after is not None:
+        try:
+            after = decode_cursor(after, key)
+        except ValueError as ve:
+            return error(400, str(ve))
+
+    if wants_ndjson(stream):
+        return ndjson_response(db_async.stream_rows(query, key, after, limit), row_to_dict=row_to_dict)
+
+    # One extra row tells us whether there is a next page
+    rows = await db_async.fetch_all(*query(after, None if limit is None else limit + 1))
+    rows, next_cursor = split_page(rows, limit, key)
+
+    resp = json_response(list(rows_func(rows)))
+
+    if next_cursor:
+        resp.headers['X-Next-Cursor'] = next_cursor
+
+    return resp
+
+
+@etag(page_version('tags', 'name'))
+async def get_tags_list(limit=None, after=None, stream=False):
+    return await list_page(tags_page_query, 'name', tag_rows, tag_row_to_dict, limit, after, stream)
+
+
+@etag(db_async.tag_detail_version)
+async def get_tag_detail(tag_id, stream=False):
+    if wants_ndjson(stream):
+        tag = await db_async.fetch_tag(tag_id)
+
+        if not tag:
+            return error(404, 'Tag not found')
+
+        # The tag itself comes first, followed by one line per node
+        nodes = db_async.stream_rows(partial(tag_nodes_query, tag_id), 'id')
+
+        return ndjson_response(nodes, head=[tag_row_to_dict(tag)], row_to_dict=node_row_to_dict)
+
+    tag = await db_async.fetch_tag_detail(tag_id)
+
+    if not tag:
+        return error(404, 'Tag not found')
+
+    return json_response(tag)
+
+
+@etag(page_version('nodes', 'id'))
+async def get_nodes_list(limit=None, after=None, stream=False):
+    return await list_page(nodes_page_query, 'id', node_rows, node_row_to_dict, limit, after, stream)
+
+
+@etag(db_async.node_detail_version)
+async def get_node_detail(node_id):
+    node = await db_async.fetch_node_detail(node_id)
+
+    if not node:
+        return error(404, 'Node not found')
+
+    return json_response(node)
+
+
+@etag(lambda node_id: db_async.paths_version([node_id]))
+async def get_node_path(node_id):
+    paths = await db_async.fetch_paths([node_id])
+
+    if node_id not in paths:
+        return error(404, 'Node not found')
+
+    return json_response(paths[node_id])
+
+
+@etag(db_async.paths_version)
+async def get_nodes_paths(node_ids):
+    paths = await db_async.fetch_paths(node_ids)
+
+    # Keep the caller's order, dropping duplicates and unknown ids
+    return json_response([{'node_id': i, 'path': paths[i]} for i in dict.fromkeys(node_ids) if i in paths])
+
+
+@etag(db_async.subtree_version)
+async def get_node_tree(node_id, max_depth=None, include_tags=False, stream=False):
+    if wants_ndjson(stream):
+        nodes = db_async.stream_subtree(node_id, max_depth=max_depth, include_tags=include_tags)
+        root = await anext(nodes, None)
+
+        if root is None:
+            return error(404, 'Node not found')
+
+        return ndjson_response(nodes, head=[root])
+
+    nodes = await db_async.fetch_subtree(node_id, max_depth=max_depth, include_tags=include_tags)
+
+    if not nodes:
+        return error(404, 'Node not found')
+
+    return json_response(list(walk_tree(nodes)))
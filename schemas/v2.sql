@@ -0,0 +1,58 @@
+-- v2: closure table over edges for single-query ancestry and subtree reads.
+
+-- Refuse to start if edges contain a parent cycle: the backfill below would
+-- recurse until cte_max_recursion_depth aborts it half done. Each node has one
+-- parent, so the nodes on or below a cycle are those not reachable from a
+-- root; a walk down from the roots can't loop. Failing the CHECK stops the
+-- script (error 3819, naming the constraint) before anything is changed.
+CREATE TEMPORARY TABLE v2_preflight (
+    nodes_in_cycles  BIGINT NOT NULL,
+    CONSTRAINT v2_edges_must_not_contain_cycles CHECK (nodes_in_cycles = 0)
+);
+
+INSERT INTO v2_preflight (nodes_in_cycles)
+WITH RECURSIVE reachable (id) AS (
+    SELECT n.id
+    FROM nodes n
+    WHERE NOT EXISTS (SELECT 1 FROM edges e WHERE e.child_id = n.id)
+    UNION ALL
+    SELECT e.child_id
+    FROM reachable r
+    JOIN edges e ON e.parent_id = r.id
+)
+SELECT (SELECT COUNT(*) FROM nodes) - (SELECT COUNT(*) FROM reachable);
+
+DROP TEMPORARY TABLE v2_preflight;
+
+UPDATE schema_version SET in_progress = TRUE WHERE version = 1;
+
+CREATE TABLE node_closure (
+    ancestor_id    BIGINT UNSIGNED NOT NULL,
+    descendant_id  BIGINT UNSIGNED NOT NULL,
+    depth          INT UNSIGNED NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    CONSTRAINT fk_node_closure_ancestor
+        FOREIGN KEY (ancestor_id) REFERENCES nodes(id)
+        ON DELETE CASCADE,
+    CONSTRAINT fk_node_closure_descendant
+        FOREIGN KEY (descendant_id) REFERENCES nodes(id)
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE INDEX idx_node_closure_descendant ON node_closure (descendant_id, depth);
+
+-- Backfill: every node is its own ancestor at depth 0, plus one row per
+-- (ancestor, descendant) pair reachable through edges.
+INSERT INTO node_closure (ancestor_id, descendant_id, depth)
+WITH RECURSIVE closure (ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0
+    FROM nodes
+    UNION ALL
+    SELECT c.ancestor_id, e.child_id, c.depth + 1
+    FROM closure c
+    JOIN edges e ON e.parent_id = c.descendant_id
+)
+SELECT ancestor_id, descendant_id, depth
+FROM closure;
+
+UPDATE schema_version SET version = 2, in_progress = FALSE WHERE version = 1;
@@ -0,0 +1,7 @@
+-- v3: index for reading a subtree level by level (streamed tree export).
+
+UPDATE schema_version SET in_progress = TRUE WHERE version = 2;
+
+CREATE INDEX idx_node_closure_ancestor_depth ON node_closure (ancestor_id, depth, descendant_id);
+
+UPDATE schema_version SET version = 3, in_progress = FALSE WHERE version = 2;
@@ -0,0 +1,134 @@
+import os
+import sys
+
+from sqlalchemy import event
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:
+    trace = None
+
+# Configuration: '' leaves tracing to whatever OpenTelemetry setup the
+# process already has (none: spans are no-ops), 'console' writes finished
+# spans to stderr, anything else is a file to append them to.
+TRACE_EXPORT = os.environ.get('TRACE_EXPORT', '')
+TRACE_SERVICE_NAME = os.environ.get('TRACE_SERVICE_NAME', 'binctl-api')
+
+_configured = False
+
+
+def setup_tracing():
+    """
+    Installs an OpenTelemetry SDK tracer provider exporting to TRACE_EXPORT.
+    Needs opentelemetry-sdk; without TRACE_EXPORT this does nothing.
+    """
+    global _configured
+
+    if _configured or not TRACE_EXPORT or trace is None:
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    out = sys.stderr if TRACE_EXPORT == 'console' else open(TRACE_EXPORT, 'a')
+    provider = TracerProvider(resource=Resource.create({'service.name': TRACE_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter(out=out)))
+    trace.set_tracer_provider(provider)
+    _configured = True
+
+
+def get_tracer():
+    return trace.get_tracer('binctl') if trace is not None else None
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware for connexion's stack that wraps each HTTP request,
+    including routing and validation, in a server span. The span continues
+    the caller's trace from its traceparent header and is named after the
+    operationId once routing has resolved it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or trace is None:
+            return await self.app(scope, receive, send)
+
+        headers = {k.decode('latin-1'): v.decode('latin-1') for k, v in scope['headers']}
+        attributes = {
+            'http.request.method': scope['method'],
+            'url.path': scope['path'],
+            'url.query': scope.get('query_string', b'').decode('latin-1'),
+        }
+
+        with get_tracer().start_as_current_span(
+            f'{scope["method"]} {scope["path"]}',
+            context=propagate.extract(headers),
+            kind=trace.SpanKind.SERVER,
+            attributes=attributes,
+        ) as span:
+
+            async def send_traced(message):
+                if message['type'] == 'http.response.start':
+                    span.set_attribute('http.response.status_code', message['status'])
+
+                    if message['status'] >= 500:
+                        span.set_status(trace.StatusCode.ERROR)
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_traced)
+            finally:
+                operation_id = scope.get('extensions', {}).get('connexion_routing', {}).get('operation_id')
+
+                if operation_id:
+                    # Resolved ids carry the controller module: 'routes.get_node_detail'
+                    span.update_name(operation_id.rpartition('.')[2])
+
+
+def trace_engine(engine):
+    """
+    Wraps every statement run on engine in a client span, a child of the
+    current request's span. Bound parameters are not recorded.
+    """
+    if trace is None:
+        return
+
+    event.listen(engine, 'before_cursor_execute', _start_statement_span)
+    event.listen(engine, 'after_cursor_execute', _end_statement_span)
+    event.listen(engine, 'handle_error', _fail_statement_span)
+
+
+def _start_statement_span(conn, cursor, statement, parameters, context, executemany):
+    conn.info['statement_span'] = get_tracer().start_span(
+        statement.split(None, 1)[0].upper(),
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            'db.system': conn.engine.dialect.name,
+            'db.statement': ' '.join(statement.split()),
+        },
+    )
+
+
+def _end_statement_span(conn, cursor, statement, parameters, context, executemany):
+    span = conn.info.pop('statement_span', None)
+
+    if span is not None:
+        if cursor.rowcount >= 0:
+            span.set_attribute('db.response.returned_rows', cursor.rowcount)
+
+        span.end()
+
+
+def _fail_statement_span(exception_context):
+    conn = exception_context.connection
+    span = conn.info.pop('statement_span', None) if conn is not None else None
+
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(trace.StatusCode.ERROR)
+        span.end()
@@ -1,18 +1,221 @@
+import copy
+import hashlib
+import json
+import os
+import re
+from collections.abc import Mapping
+from functools import wraps
+
 import connexion
+import yaml
 from a2wsgi import ASGIMiddleware
-from flask import g, jsonify
+from connexion.middleware import MiddlewarePosition
+from flask import Response, current_app, g, jsonify, make_response, request, stream_with_context
+from flask.json.provider import JSONProvider
+
+from cache import data_version, flush_invalidations
+from compression import CompressionMiddleware, compress_response, negotiate_encoding
+from instrumentation import log_request, start_request_timer
+from metrics import measure_asgi, metrics_endpoint, record_request
+from tracing import TracingMiddleware, setup_tracing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Next to this module, like connexion's specification_dir='.'
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'openapi.yaml')
+
+# With orjson, result rows and datetimes can be handed to jsonify() as-is
+FAST_JSON = orjson is not None
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson. Serialises datetimes natively (same
+    ISO 8601 text as isoformat()) and database rows through _default(),
+    so handlers can skip building per-row dicts. Keys are sorted like
+    Flask's default provider.
+    """
+
+    option = orjson.OPT_SORT_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+
+        return self._app.response_class(json_bytes(obj), mimetype='application/json')
+
+
+def json_bytes(obj):
+    """
+    Serialises obj exactly like jsonify() does (sorted keys, compact,
+    trailing newline), for responses built outside Flask.
+    """
+    if FAST_JSON:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+    return (json.dumps(obj, sort_keys=True, separators=(',', ':')) + '\n').encode()
+
+
+def _default(obj):
+    # RowMapping and friends
+    if isinstance(obj, Mapping):
+        return dict(obj)
+
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
 
 
 def create_app():
+    """
+    WSGI entry point (Flask dev server, gunicorn sync/gthread workers).
+    Requests pass through connexion's ASGI middleware via a2wsgi.
+    """
+    cx_app = create_connexion_app()
+    cx_app.app.wsgi_app = ASGIMiddleware(cx_app.middleware)
+
+    return cx_app.app
+
+
+def create_asgi_app():
+    """
+    Native ASGI entry point for uvicorn (or gunicorn with uvicorn workers).
+    The middleware stack runs on the event loop and the Flask handlers,
+    with their blocking DB calls, in connexion's worker thread pool.
+
+    With ASYNC_DATABASE_URL set, the read endpoints in routes_async are
+    served by a connexion AsyncApp on the event loop instead, so slow tree
+    and path queries don't each hold a thread.
+    """
+    from db_async import ASYNC_DATABASE_URL
+
+    cx_app = create_connexion_app()
+
+    if not ASYNC_DATABASE_URL:
+        return cx_app
+
+    import routes_async
+
+    with open(SPEC_PATH) as f:
+        spec = async_spec(yaml.safe_load(f), routes_async.OPERATIONS)
+
+    async_app = connexion.AsyncApp(__name__, specification_dir='.')
+    async_app.add_api(spec, strict_validation=True, validate_responses=False)
+    async_app.add_middleware(TracingMiddleware, position=MiddlewarePosition.BEFORE_EXCEPTION)
+
+    return AsyncReadsDispatcher(CompressionMiddleware(async_app), cx_app, spec)
+
+
+def async_spec(spec, operation_ids):
+    """
+    Returns a copy of the OpenAPI spec with only the given operations,
+    routed to routes_async.
+    """
+    spec = copy.deepcopy(spec)
+
+    for path, item in list(spec['paths'].items()):
+        for method in [m for m in item if m != 'parameters']:
+            if item[method]['operationId'] in operation_ids:
+                item[method]['x-openapi-router-controller'] = 'routes_async'
+            else:
+                del item[method]
+
+        if set(item) <= {'parameters'}:
+            del spec['paths'][path]
+
+    return spec
+
+
+class AsyncReadsDispatcher:
+    """
+    ASGI app that sends requests for the operations in async_spec to
+    async_app and everything else (writes, other reads, lifespan) to app.
+    On lifespan shutdown it also closes the async engine's connections.
+    """
+
+    def __init__(self, async_app, app, async_spec):
+        self.async_app = async_app
+        self.app = app
+        self.routes = [
+            (method.upper(), re.compile('^' + re.sub(r'\{[^}]+\}', '[^/]+', path) + '$'), operation['operationId'])
+            for path, item in async_spec['paths'].items()
+            for method, operation in item.items()
+            if method != 'parameters'
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            for method, pattern, operation_id in self.routes:
+                if scope['method'] == method and pattern.match(scope['path']):
+                    return await measure_asgi(self.async_app, operation_id, scope, receive, send)
+
+        if scope['type'] == 'lifespan':
+            return await self.app(scope, receive, self.dispose_on_shutdown(send))
+
+        return await self.app(scope, receive, send)
+
+    @staticmethod
+    def dispose_on_shutdown(send):
+        from db_async import dispose_async_engine
+
+        async def send_lifespan(message):
+            if message['type'] == 'lifespan.shutdown.complete':
+                await dispose_async_engine()
+
+            await send(message)
+
+        return send_lifespan
+
+
+def create_connexion_app():
     # App setup
     cx_app = connexion.App(__name__, specification_dir='.')
     cx_app.add_api('openapi.yaml', strict_validation=True, validate_responses=False)
-    cx_app.app.wsgi_app = ASGIMiddleware(cx_app.middleware)
+
+    # Tracing spans around each request, from before routing and validation
+    setup_tracing()
+    cx_app.add_middleware(TracingMiddleware, position=MiddlewarePosition.BEFORE_EXCEPTION)
+
+    if FAST_JSON:
+        cx_app.app.json = OrjsonProvider(cx_app.app)
+
+    # Operational endpoints
+    cx_app.app.add_url_rule('/_status/pool', 'pool_status', pool_status)
+    cx_app.app.add_url_rule('/metrics', 'metrics', metrics_endpoint)
+
+    # Per-request SQL timing and metrics; registered first so they run after
+    # the other hooks and see the final (compressed) response
+    cx_app.app.before_request(start_request_timer)
+    cx_app.app.after_request(log_request)
+    cx_app.app.after_request(record_request)
+
+    # Read-your-writes with read replicas
+    from db import stick_to_primary
+
+    cx_app.app.after_request(stick_to_primary)
+
+    # Response compression
+    cx_app.app.after_request(compress_response)
 
     # App teardown
     cx_app.app.teardown_appcontext(close_db)
+    cx_app.app.teardown_appcontext(flush_invalidations)
 
-    return cx_app.app
+    return cx_app
+
+
+def pool_status():
+    from db import pool_stats
+
+    return jsonify(pool_stats())
 
 
 def close_db(exc=None):
@@ -27,3 +230,79 @@ def error(status, message):
     resp.status_code = status
 
     return resp
+
+
+def wants_ndjson(stream=False):
+    """
+    True if the client asked for newline-delimited JSON, either with
+    ?stream=true or by preferring application/x-ndjson in Accept.
+    """
+    if stream:
+        return True
+
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(items):
+    """
+    Streams an iterable of JSON-serialisable items, one per line.
+    The iterable is consumed lazily while the response is being sent.
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        for item in items:
+            yield dumps(item, separators=(',', ':')) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def make_etag(full_path, ndjson, encoding, version):
+    """
+    The same data renders differently per query string, format and content
+    coding, so all of them go into the tag. full_path is path?query.
+    """
+    key = repr((full_path, ndjson, encoding, version))
+
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def etag(version_func):
+    """
+    Adds a strong ETag to a GET handler's 200 responses. version_func is
+    called with the handler's arguments and returns a cheap version of the
+    data behind the response, or None if it can't tell. When the client's
+    If-None-Match matches, a 304 is returned without calling the handler.
+    Otherwise the handler runs under cache.data_version(), so cached data it
+    reads is at the version the ETag was derived from.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version = version_func(*args, **kwargs)
+
+            if version is None:
+                return view(*args, **kwargs)
+
+            tag = make_etag(request.full_path, wants_ndjson(), negotiate_encoding(), version)
+
+            if request.if_none_match.contains(tag):
+                resp = Response(status=304)
+            else:
+                with data_version(version_func, version):
+                    resp = make_response(view(*args, **kwargs))
+
+                if resp.status_code != 200:
+                    return resp
+
+            resp.set_etag(tag)
+            # The tag depends on both, so a 304 varies like the 200 it validates
+            resp.vary.add('Accept')
+            resp.vary.add('Accept-Encoding')
+
+            return resp
+
+        return wrapper
+
+    return decorator